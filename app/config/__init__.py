@@ -13,6 +13,8 @@ from .logging import (
     setup_logging,
     get_logger,
     set_correlation_id,
+    bind_correlation_id,
+    reset_correlation_id,
     get_correlation_id,
     log_request,
     log_database_query,
@@ -40,6 +42,8 @@ __all__ = [
     "setup_logging",
     "get_logger",
     "set_correlation_id",
+    "bind_correlation_id",
+    "reset_correlation_id",
     "get_correlation_id",
     "log_request",
     "log_database_query",
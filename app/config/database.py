@@ -49,6 +49,8 @@ class DatabaseConfig:
             "pool_timeout": settings.database_pool_timeout,
             "pool_recycle": settings.database_pool_recycle,
             "pool_pre_ping": True,  # Validate connections before use
+            "query_cache_size": settings.database_query_cache_size,  # Reuse compiled SQL across requests
+            "insertmanyvalues_page_size": settings.database_insertmanyvalues_page_size,  # Rows per bulk INSERT
         }
         
         # Additional production optimizations
@@ -68,7 +70,8 @@ class DatabaseConfig:
         
         logger.info(
             f"Database engine created with pool_size={settings.database_pool_size}, "
-            f"max_overflow={settings.database_max_overflow}"
+            f"max_overflow={settings.database_max_overflow}, "
+            f"query_cache_size={settings.database_query_cache_size}"
         )
         
         return engine
@@ -8,7 +8,7 @@ import json
 from datetime import datetime
 from typing import Dict, Any, Optional
 import uuid
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 
 from .settings import settings
 
@@ -188,6 +188,29 @@ def set_correlation_id(request_id: Optional[str] = None) -> str:
     return request_id
 
 
+def bind_correlation_id(request_id: str) -> Token:
+    """
+    Set correlation ID for the current request scope.
+    
+    Args:
+        request_id: Correlation ID to bind
+        
+    Returns:
+        Token: Token to pass to reset_correlation_id when the request ends
+    """
+    return correlation_id.set(request_id)
+
+
+def reset_correlation_id(token: Token) -> None:
+    """
+    Restore the correlation ID that was active before bind_correlation_id.
+    
+    Args:
+        token: Token returned by bind_correlation_id
+    """
+    correlation_id.reset(token)
+
+
 def get_correlation_id() -> Optional[str]:
     """
     Get current correlation ID.
@@ -40,6 +40,8 @@ class Settings(BaseSettings):
     database_pool_timeout: int = Field(default=30, description="Database pool timeout in seconds")
     database_pool_recycle: int = Field(default=3600, description="Database pool recycle time in seconds")
     database_echo: bool = Field(default=False, description="Echo SQL queries")
+    database_query_cache_size: int = Field(default=1200, description="Compiled SQL statement cache size per engine")
+    database_insertmanyvalues_page_size: int = Field(default=1000, description="Rows per multi-row INSERT statement in bulk inserts")
     
     # Redis Settings
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
@@ -11,6 +11,7 @@ import redis
 from app.config.database import db_config
 from app.config.redis import redis_config, get_cache_manager, get_session_manager
 from app.config.security import security_config
+from app.core.health import cached_db_health, cached_redis_health
 
 
 def get_database_session() -> Generator[Session, None, None]:
@@ -46,14 +47,14 @@ def get_database_engine() -> Engine:
     return db_config.engine
 
 
-def get_database_health() -> bool:
+async def get_database_health() -> bool:
     """
     FastAPI dependency for database health check.
     
     Returns:
         bool: True if database is healthy, False otherwise
     """
-    return db_config.health_check()
+    return await cached_db_health()
 
 
 def get_redis_client() -> redis.Redis:
@@ -69,14 +70,14 @@ def get_redis_client() -> redis.Redis:
 # Removed unused cache and session manager dependencies
 
 
-def get_redis_health() -> bool:
+async def get_redis_health() -> bool:
     """
     FastAPI dependency for Redis health check.
     
     Returns:
         bool: True if Redis is healthy, False otherwise
     """
-    return redis_config.health_check()
+    return await cached_redis_health()
 
 
 # Security dependencies
@@ -0,0 +1,68 @@
+"""
+Cached health probes for database and Redis.
+"""
+import asyncio
+import time
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config.database import db_config
+from app.config.redis import redis_config
+
+# How long a probe result is reused before hitting the backend again
+HEALTH_CACHE_TTL = 5.0  # seconds
+
+
+class _HealthCache:
+    """Short-lived snapshot of a blocking health probe result."""
+    
+    def __init__(self, probe: Callable[[], bool], ttl: float = HEALTH_CACHE_TTL):
+        self._probe = probe
+        self._ttl = ttl
+        self._value = False
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def get(self) -> bool:
+        """
+        Get the probe result, refreshing it in a threadpool when stale.
+        
+        Returns:
+            bool: True if the backend is healthy, False otherwise
+        """
+        if time.monotonic() < self._expires_at:
+            return self._value
+        
+        async with self._lock:
+            # Another waiter may have refreshed while we waited for the lock
+            if time.monotonic() < self._expires_at:
+                return self._value
+            
+            self._value = await run_in_threadpool(self._probe)
+            self._expires_at = time.monotonic() + self._ttl
+            return self._value
+
+
+_db_health = _HealthCache(db_config.health_check)
+_redis_health = _HealthCache(redis_config.health_check)
+
+
+async def cached_db_health() -> bool:
+    """
+    Check database health, reusing a recent result.
+    
+    Returns:
+        bool: True if database is healthy, False otherwise
+    """
+    return await _db_health.get()
+
+
+async def cached_redis_health() -> bool:
+    """
+    Check Redis health, reusing a recent result.
+    
+    Returns:
+        bool: True if Redis is healthy, False otherwise
+    """
+    return await _redis_health.get()
@@ -1,25 +1,29 @@
 """
 Pagination utilities for API responses.
 """
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from typing import Any, Dict, Iterable, List, Optional, TypeVar, Generic
+from dataclasses import dataclass
+from itertools import islice
 from math import ceil
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 T = TypeVar('T')
 
+# Sentinel marking the end of an iterator when peeking
+_EXHAUSTED = object()
 
-class PaginationParams(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class PaginationParams:
     """Pagination parameters for API requests."""
     
     page: int = 1
     per_page: int = 20
     
-    def __init__(self, page: int = 1, per_page: int = 20, **kwargs):
+    def __post_init__(self):
         # Validate and sanitize pagination parameters
-        page = max(1, page)  # Ensure page is at least 1
-        per_page = min(max(1, per_page), 100)  # Limit per_page between 1 and 100
-        
-        super().__init__(page=page, per_page=per_page, **kwargs)
+        object.__setattr__(self, "page", max(1, self.page))  # Ensure page is at least 1
+        object.__setattr__(self, "per_page", min(max(1, self.per_page), 100))  # Limit per_page between 1 and 100
     
     @property
     def offset(self) -> int:
@@ -35,6 +39,8 @@ class PaginationParams(BaseModel):
 class PaginationMeta(BaseModel):
     """Pagination metadata for API responses."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     page: int
     per_page: int
     total: int
@@ -75,7 +81,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
         has_prev = page > 1
         has_next = page < pages
         
-        pagination = PaginationMeta(
+        # The metadata is computed from these ints, so its validation can be skipped;
+        # this check must survive python -O, unlike an assert
+        if not all(isinstance(value, int) for value in (page, per_page, total)):
+            raise TypeError("page, per_page and total must be ints")
+        
+        pagination = PaginationMeta.model_construct(
             page=page,
             per_page=per_page,
             total=total,
@@ -86,6 +97,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
             next_page=page + 1 if has_next else None
         )
         
+        # Items are still validated so they are coerced into T
         return cls(items=items, pagination=pagination)
 
 
@@ -117,6 +129,60 @@ def paginate(
     )
 
 
+def iter_paginate(
+    iterable: Iterable[T],
+    page: int = 1,
+    per_page: int = 20,
+    total: Optional[int] = None
+) -> PaginatedResponse[T]:
+    """
+    Paginate an iterable, materializing only the items of the requested page.
+    
+    Args:
+        iterable: Iterable of items to paginate (e.g. a streamed query result)
+        page: Page number
+        per_page: Items per page
+        total: Total number of items if known (e.g. from a COUNT query)
+        
+    Returns:
+        PaginatedResponse with paginated items. When total is not provided,
+        pages is 0, total counts the items up to the end of this page and
+        has_next is determined by peeking one item past the page.
+    """
+    # Clamp like PaginationParams; islice rejects negative offsets
+    params = PaginationParams(page=page, per_page=per_page)
+    page, per_page, offset = params.page, params.per_page, params.offset
+    iterator = iter(iterable)
+    
+    # Skip items before the requested page without storing them
+    next(islice(iterator, offset, offset), None)
+    page_items = list(islice(iterator, per_page))
+    
+    if total is not None:
+        return PaginatedResponse.create(
+            items=page_items,
+            total=total,
+            page=page,
+            per_page=per_page
+        )
+    
+    has_prev = page > 1
+    has_next = next(iterator, _EXHAUSTED) is not _EXHAUSTED
+    
+    pagination = PaginationMeta.model_construct(
+        page=page,
+        per_page=per_page,
+        total=offset + len(page_items),
+        pages=0,
+        has_prev=has_prev,
+        has_next=has_next,
+        prev_page=page - 1 if has_prev else None,
+        next_page=page + 1 if has_next else None
+    )
+    
+    return PaginatedResponse(items=page_items, pagination=pagination)
+
+
 def get_pagination_links(
     base_url: str,
     page: int,
@@ -3,7 +3,10 @@ Rate limiting utilities for API endpoints security.
 """
 import time
 import json
+import asyncio
+import inspect
 import logging
+import threading
 from typing import Optional, Dict, Tuple
 from fastapi import HTTPException, Request, status
 from functools import wraps
@@ -12,6 +15,9 @@ from app.config.redis import get_cache_manager
 
 logger = logging.getLogger(__name__)
 
+# Redis pub/sub channel used to share rate-limit state between workers
+RATE_LIMIT_CHANNEL = "rate_limit_events"
+
 
 class RateLimiter:
     """Rate limiting service for security-critical endpoints."""
@@ -27,6 +33,42 @@ class RateLimiter:
             "password_change": {"max_attempts": 3, "window": 1800},  # 3 attempts per 30 minutes
             "refresh": {"max_attempts": 10, "window": 300},  # 10 attempts per 5 minutes
         }
+        
+        # Keys with failed attempts recorded by this process (or by other
+        # workers, once subscribed to rate-limit events), mapped to the
+        # monotonic time their window expires. Identifiers that never failed
+        # are allowed without a Redis round-trip once the subscription is warm
+        # and Redis has recently confirmed them clean.
+        self._active: Dict[str, float] = {}
+        self._active_maxsize = 200_000
+        
+        # Keys Redis last reported clean, mapped to the monotonic time that
+        # answer expires. Pub/sub is lossy, so a local miss is only trusted for
+        # this long before Redis is asked again.
+        self._verified: Dict[str, float] = {}
+        self._verified_maxsize = 200_000
+        self._recheck_interval = 30
+        
+        # Monotonic time after which _active has seen every failure still inside
+        # the longest window; None while not subscribed
+        self._warm_at: Optional[float] = None
+        
+        # In-flight async checks per key, shared by concurrent callers
+        self._inflight: Dict[str, "asyncio.Future[Tuple[bool, Optional[int]]]"] = {}
+        
+        # Eventually-consistent copies of Redis state, fed by pub/sub:
+        # rate limit key -> (attempts, window_start), lockout key -> unlock_time
+        self._mirror: Dict[str, Tuple[int, int]] = {}
+        self._lockouts: Dict[str, int] = {}
+        self._lockouts_maxsize = 10_000
+        self._pubsub_thread = None
+        
+        # Pause between reconnect attempts after the subscription fails
+        self._resubscribe_delay = 1.0
+        
+        # The pub/sub listener thread and executor threads share _active, _mirror
+        # and _lockouts with the event loop; every access goes through this lock
+        self._lock = threading.RLock()
     
     def _get_key(self, endpoint: str, identifier: str) -> str:
         """Generate rate limit cache key."""
@@ -36,6 +78,175 @@ class RateLimiter:
         """Generate account lockout cache key."""
         return f"account_lockout:{identifier}"
     
+    def _is_active(self, key: str) -> bool:
+        """Check whether a key has unexpired failed attempts."""
+        with self._lock:
+            expires_at = self._active.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                self._active.pop(key, None)
+                self._mirror.pop(key, None)
+                return False
+            return True
+    
+    def _is_subscribed(self) -> bool:
+        """Check whether the pub/sub listener thread is running."""
+        thread = self._pubsub_thread
+        return thread is not None and thread.is_alive()
+    
+    def _is_known_clean(self, key: str) -> bool:
+        """
+        Check whether a key can skip Redis because it has no recent failures.
+        
+        Until the subscription has run for the longest window, failures recorded
+        before this worker started are only in Redis, so a local miss proves nothing.
+        The same holds once the listener thread has died. Even when warm, a single
+        dropped event would hide failures, so the key must also have been seen
+        clean in Redis within the re-check interval.
+        """
+        if self._is_active(key):
+            return False
+        now = time.monotonic()
+        warm_at = self._warm_at
+        if warm_at is None or now < warm_at or not self._is_subscribed():
+            return False
+        with self._lock:
+            verified_until = self._verified.get(key)
+            if verified_until is None:
+                return False
+            if verified_until <= now:
+                del self._verified[key]
+                return False
+            return True
+    
+    def _reset_warmup(self) -> None:
+        """Drop mirrored state and fall back to Redis for the longest window."""
+        self._warm_at = time.monotonic() + max(config["window"] for config in self.limits.values())
+        with self._lock:
+            self._mirror.clear()
+            self._verified.clear()
+    
+    def _mark_verified(self, key: str) -> None:
+        """Remember that Redis reported a key as having no failed attempts."""
+        with self._lock:
+            if key not in self._verified and len(self._verified) >= self._verified_maxsize:
+                now = time.monotonic()
+                for expired in [k for k, v in self._verified.items() if v <= now]:
+                    del self._verified[expired]
+                if len(self._verified) >= self._verified_maxsize:
+                    # Still full, drop the oldest entry; it is re-checked on next use
+                    del self._verified[next(iter(self._verified))]
+            self._verified[key] = time.monotonic() + self._recheck_interval
+    
+    def _mark_active(self, key: str, window: int) -> None:
+        """Remember a key as having failed attempts for the given window."""
+        with self._lock:
+            if key not in self._active and len(self._active) >= self._active_maxsize:
+                now = time.monotonic()
+                for expired in [k for k, v in self._active.items() if v <= now]:
+                    del self._active[expired]
+                    self._mirror.pop(expired, None)
+                if len(self._active) >= self._active_maxsize:
+                    # Still full, drop the oldest entry
+                    oldest = next(iter(self._active))
+                    del self._active[oldest]
+                    self._mirror.pop(oldest, None)
+            self._active[key] = time.monotonic() + window
+    
+    def _store_lockout(self, key: str, unlock_time: int) -> None:
+        """Remember a lockout, pruning expired ones so the map stays bounded."""
+        with self._lock:
+            if key not in self._lockouts and len(self._lockouts) >= self._lockouts_maxsize:
+                now = int(time.time())
+                for expired in [k for k, v in self._lockouts.items() if v <= now]:
+                    del self._lockouts[expired]
+                if len(self._lockouts) >= self._lockouts_maxsize:
+                    # Still full, forget the one that unlocks soonest; Redis still has it
+                    del self._lockouts[min(self._lockouts, key=self._lockouts.__getitem__)]
+            self._lockouts[key] = unlock_time
+    
+    def start_event_subscription(self) -> None:
+        """
+        Subscribe to rate-limit events published by other workers.
+        
+        Once subscribed, check_rate_limit answers from the in-process mirror
+        and only mutations go to Redis. Safe to call more than once; a dead
+        listener thread is replaced.
+        """
+        if self._is_subscribed():
+            return
+        
+        try:
+            pubsub = self.cache.redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{RATE_LIMIT_CHANNEL: self._handle_event})
+            self._pubsub_thread = pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._handle_subscription_error
+            )
+            self._reset_warmup()
+        except Exception as e:
+            logger.error(f"Failed to subscribe to rate limit events: {e}")
+    
+    def _handle_subscription_error(self, error: BaseException, pubsub, thread) -> None:
+        """
+        Pub/sub worker callback for errors raised while reading messages.
+        
+        Events published while disconnected are lost, so the mirror is dropped
+        and checks go back to Redis for the longest window. The worker keeps
+        running; redis-py reconnects and resubscribes on its next read.
+        """
+        logger.error(f"Rate limit subscription error, resubscribing: {error}")
+        self._reset_warmup()
+        time.sleep(self._resubscribe_delay)
+    
+    def stop_event_subscription(self) -> None:
+        """Stop listening for rate-limit events and drop mirrored state."""
+        if self._pubsub_thread is None:
+            return
+        
+        try:
+            self._pubsub_thread.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop rate limit subscription: {e}")
+        finally:
+            self._pubsub_thread = None
+            self._warm_at = None
+            with self._lock:
+                self._mirror.clear()
+                self._verified.clear()
+    
+    def _publish_event(self, event: Dict[str, int]) -> None:
+        """Apply a state change locally and fan it out to other workers."""
+        self._apply_event(event)
+        try:
+            self.cache.redis.publish(RATE_LIMIT_CHANNEL, json.dumps(event))
+        except Exception as e:
+            logger.error(f"Failed to publish rate limit event: {e}")
+    
+    def _handle_event(self, message: Dict) -> None:
+        """Pub/sub callback for messages on the rate-limit channel."""
+        try:
+            self._apply_event(json.loads(message["data"]))
+        except Exception as e:
+            logger.error(f"Invalid rate limit event: {e}")
+    
+    def _apply_event(self, event: Dict) -> None:
+        """Update mirrored state from a rate-limit event."""
+        key = event["key"]
+        if "unlock_time" in event:
+            self._store_lockout(key, event["unlock_time"])
+            return
+        
+        with self._lock:
+            if event["attempts"]:
+                self._mirror[key] = (event["attempts"], event["window_start"])
+                self._mark_active(key, event["ttl"])
+            else:
+                self._mirror.pop(key, None)
+                self._active.pop(key, None)
+    
     def check_rate_limit(self, endpoint: str, identifier: str) -> Tuple[bool, Optional[int]]:
         """
         Check if request is within rate limits.
@@ -53,25 +264,49 @@ class RateLimiter:
         config = self.limits[endpoint]
         key = self._get_key(endpoint, identifier)
         
+        # Fast path: no recent failures seen for this identifier
+        if self._is_known_clean(key):
+            return True, None
+        
         try:
-            # Get current attempts
-            data = self.cache.get(key)
             current_time = int(time.time())
             
-            if data:
+            # Get current attempts, from the mirror when subscribed
+            mirrored = None
+            if self._is_subscribed():
+                with self._lock:
+                    mirrored = self._mirror.get(key)
+            if mirrored is not None:
+                attempts, window_start = mirrored
+            else:
+                data = self.cache.get(key)
+                if not data:
+                    self._mark_verified(key)
+                    return True, None
                 attempts_data = json.loads(data)
                 attempts = attempts_data.get("attempts", 0)
                 window_start = attempts_data.get("window_start", current_time)
                 
-                # Check if window has expired
-                if current_time - window_start >= config["window"]:
-                    # Reset window
-                    attempts = 0
-                    window_start = current_time
-                
-                if attempts >= config["max_attempts"]:
-                    retry_after = config["window"] - (current_time - window_start)
-                    return False, max(retry_after, 0)
+                # Failures recorded before this worker subscribed; later events keep this current
+                remaining = config["window"] - (current_time - window_start)
+                if attempts and remaining > 0:
+                    with self._lock:
+                        # An event applied since the GET is newer; keep it
+                        if key not in self._mirror:
+                            self._mirror[key] = (attempts, window_start)
+                            self._mark_active(key, remaining)
+                else:
+                    self._mark_verified(key)
+            
+            # Check if window has expired
+            if current_time - window_start >= config["window"]:
+                # Reset window
+                attempts = 0
+                window_start = current_time
+            
+            if attempts >= config["max_attempts"]:
+                retry_after = config["window"] - (current_time - window_start)
+                return False, max(retry_after, 0)
             
             return True, None
             
@@ -79,6 +314,41 @@ class RateLimiter:
             logger.error(f"Rate limit check failed: {e}")
             return True, None  # Fail open for availability
     
+    async def acheck_rate_limit(self, endpoint: str, identifier: str) -> Tuple[bool, Optional[int]]:
+        """
+        Async variant of check_rate_limit that coalesces concurrent checks.
+        
+        Concurrent calls for the same endpoint and identifier share a single
+        Redis lookup, which runs in the default executor so the event loop
+        is not blocked.
+        
+        Args:
+            endpoint: API endpoint name
+            identifier: User identifier (email/IP)
+            
+        Returns:
+            Tuple of (allowed, retry_after_seconds)
+        """
+        if endpoint not in self.limits:
+            return True, None
+        
+        key = self._get_key(endpoint, identifier)
+        if self._is_known_clean(key):
+            return True, None
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self.check_rate_limit, endpoint, identifier)
+        self._inflight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+    
     def record_attempt(self, endpoint: str, identifier: str, success: bool = False) -> None:
         """
         Record an attempt against rate limits.
@@ -127,6 +397,7 @@ class RateLimiter:
             }
             
             self.cache.set(key, json.dumps(new_data), timeout=config["window"])
+            self._publish_event({"key": key, "ttl": config["window"], **new_data})
             
         except Exception as e:
             logger.error(f"Failed to record rate limit attempt: {e}")
@@ -143,6 +414,16 @@ class RateLimiter:
         """
         key = self._get_lockout_key(email)
         
+        # A lockout published by any worker is answered locally
+        current_time = int(time.time())
+        with self._lock:
+            unlock_time = self._lockouts.get(key)
+            if unlock_time is not None and current_time >= unlock_time:
+                self._lockouts.pop(key, None)
+                unlock_time = None
+        if unlock_time is not None:
+            return True, unlock_time - current_time
+        
         try:
             data = self.cache.get(key)
             if data:
@@ -182,6 +463,7 @@ class RateLimiter:
             }
             
             self.cache.set(key, json.dumps(lockout_data), timeout=duration)
+            self._publish_event({"key": key, "unlock_time": unlock_time})
             logger.warning(f"Account temporarily locked: {email} for {duration} seconds")
             
         except Exception as e:
@@ -224,30 +506,23 @@ def rate_limit(endpoint: str, identifier_key: str = "email"):
         identifier_key: Key to extract from request body for identifier (default: "email")
     """
     def decorator(func):
+        # Resolve the Request parameter once instead of scanning args per call
+        req_idx, req_name = _find_request_param(func)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Extract request and identifier
-            request_obj = None
             identifier = None
-            
-            # Find FastAPI Request object
-            for arg in args:
-                if isinstance(arg, Request):
-                    request_obj = arg
-                    break
-            
-            # Look for request object in kwargs
-            if request_obj is None:
-                for key, value in kwargs.items():
-                    if isinstance(value, Request):
-                        request_obj = value
-                        break
+            if req_name is None:
+                request_obj = None
+            elif len(args) > req_idx:
+                request_obj = args[req_idx]
+            else:
+                request_obj = kwargs.get(req_name)
             
             # Extract identifier from request body
-            if request_obj and hasattr(request_obj, 'json'):
+            if request_obj is not None:
                 try:
-                    # Find the request body parameter
-                    request_body = None
                     for arg in args:
                         if hasattr(arg, identifier_key):
                             identifier = getattr(arg, identifier_key).lower().strip()
@@ -255,15 +530,15 @@ def rate_limit(endpoint: str, identifier_key: str = "email"):
                     
                     # If not found in args, default to IP
                     if not identifier:
-                        identifier = get_client_identifier(request_obj) if request_obj else "unknown"
+                        identifier = get_client_identifier(request_obj)
                         
                 except Exception:
-                    identifier = get_client_identifier(request_obj) if request_obj else "unknown"
+                    identifier = get_client_identifier(request_obj)
             else:
                 identifier = "unknown"
             
             # Check rate limit
-            allowed, retry_after = rate_limiter.check_rate_limit(endpoint, identifier)
+            allowed, retry_after = await rate_limiter.acheck_rate_limit(endpoint, identifier)
             
             if not allowed:
                 raise HTTPException(
@@ -289,16 +564,45 @@ def rate_limit(endpoint: str, identifier_key: str = "email"):
     return decorator
 
 
+def _find_request_param(func) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Locate the FastAPI ``Request`` parameter of an endpoint.
+    
+    Args:
+        func: Endpoint function being decorated
+        
+    Returns:
+        Tuple of (positional_index, parameter_name), or (None, None) if absent
+    """
+    for index, (name, param) in enumerate(inspect.signature(func).parameters.items()):
+        if param.annotation is Request:
+            return index, name
+    return None, None
+
+
 def get_client_identifier(request: Request) -> str:
     """Extract client identifier for rate limiting."""
-    # Try to get real IP from headers (for reverse proxy setups)
-    real_ip = request.headers.get("X-Real-IP")
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    cached = getattr(request.state, "client_id", None)
+    if cached is not None:
+        return cached
+    
+    # Try to get real IP from headers (for reverse proxy setups) in a single
+    # pass over the raw ASGI headers; X-Real-IP wins over X-Forwarded-For
+    forwarded_for = None
+    client_id = None
+    for name, value in request.scope.get("headers", ()):
+        if name == b"x-real-ip" and value:
+            client_id = value.decode("latin-1")
+            break
+        if forwarded_for is None and name == b"x-forwarded-for" and value:
+            forwarded_for = value
+    
+    if client_id is None:
+        if forwarded_for is not None:
+            # Get first IP from X-Forwarded-For header
+            client_id = forwarded_for.decode("latin-1").split(",")[0].strip()
+        else:
+            client_id = request.client.host
     
-    if real_ip:
-        return real_ip
-    elif forwarded_for:
-        # Get first IP from X-Forwarded-For header
-        return forwarded_for.split(",")[0].strip()
-    else:
-        return request.client.host
+    request.state.client_id = client_id
+    return client_id
@@ -2,16 +2,24 @@
 Security audit logging for authentication events.
 """
 import json
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Tuple, Deque
 from datetime import datetime
 from enum import Enum
 
+from app.config.redis import get_redis_client
 from app.utils.datetime import get_current_utc_time
 
 # Configure security logger
 security_logger = logging.getLogger("security_audit")
 
+# Redis Stream that receives audit events when stream shipping is enabled
+SECURITY_AUDIT_STREAM = "sec_audit"
+_STREAM_MAXLEN = 100_000
+_FLUSH_INTERVAL = 0.02  # seconds
+
 
 class SecurityEventType(str, Enum):
     """Security event types for audit logging."""
@@ -44,11 +52,120 @@ class SecurityEventType(str, Enum):
     TOKEN_REVOKED = "token_revoked"
 
 
+# Events always logged at WARNING level regardless of outcome
+_WARNING_EVENTS = frozenset({
+    SecurityEventType.RATE_LIMIT_EXCEEDED,
+    SecurityEventType.ACCOUNT_LOCKED,
+    SecurityEventType.SUSPICIOUS_ACTIVITY
+})
+
+# High-frequency events that skip dict building when they carry no extra data
+_TEMPLATED_EVENTS = (
+    SecurityEventType.LOGIN_SUCCESS,
+    SecurityEventType.LOGIN_FAILURE,
+    SecurityEventType.RATE_LIMIT_EXCEEDED
+)
+
+# Optional string fields in the order they appear in the full event record
+_OPTIONAL_FIELDS = ("user_email", "user_id", "ip_address", "user_agent", "error_message")
+
+
+def _build_template(event_type: SecurityEventType, success: bool) -> str:
+    """
+    Pre-render the fixed part of a security event JSON record.
+    
+    The record is serialized once with sentinel values and the sentinels are
+    replaced with format placeholders, so the output matches json.dumps of
+    the general path byte for byte.
+    """
+    rendered = json.dumps({
+        "timestamp": "\x00ts",
+        "event_type": event_type.value,
+        "success": success,
+        "\x00rest": None,
+        "additional_data": {}
+    })
+    rendered = rendered.replace("{", "{{").replace("}", "}}")
+    return rendered.replace(
+        '"\\u0000ts"', '"{ts}"'
+    ).replace(', "\\u0000rest": null', "{rest}")
+
+
+_TEMPLATES: Dict[Tuple[SecurityEventType, bool], str] = {
+    (event_type, success): _build_template(event_type, success)
+    for event_type in _TEMPLATED_EVENTS
+    for success in (True, False)
+}
+
+
 class SecurityAuditLogger:
     """Security audit logging service."""
     
     def __init__(self):
         self.logger = security_logger
+        
+        # Pending (log level, JSON record) pairs awaiting a stream flush
+        self._buffer: Deque[Tuple[int, str]] = deque()
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def start_stream_shipping(self) -> None:
+        """
+        Ship audit events to the Redis Stream in batches.
+        
+        Must be called from a running event loop. Until it is called, events
+        are written to the security logger directly.
+        """
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+    
+    async def stop_stream_shipping(self) -> None:
+        """Stop the background flusher and ship any buffered events."""
+        task, self._flush_task = self._flush_task, None
+        if task is None:
+            return
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await self._flush()
+    
+    async def _flush_loop(self) -> None:
+        """Flush buffered events every flush interval."""
+        while True:
+            await asyncio.sleep(_FLUSH_INTERVAL)
+            await self._flush()
+    
+    async def _flush(self) -> None:
+        """Write all buffered events to the stream in one pipeline."""
+        if not self._buffer:
+            return
+        
+        batch = []
+        while self._buffer:
+            batch.append(self._buffer.popleft())
+        
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+        except Exception as e:
+            # Never lose audit events, fall back to the logger
+            self.logger.error(f"Failed to ship security events to Redis: {e}")
+            for level, record in batch:
+                self.logger.log(level, f"SECURITY_EVENT: {record}")
+    
+    @staticmethod
+    def _write_batch(batch: list) -> None:
+        """XADD a batch of records using a single non-transactional pipeline."""
+        pipe = get_redis_client().pipeline(transaction=False)
+        for _, record in batch:
+            pipe.xadd(
+                SECURITY_AUDIT_STREAM,
+                {"event": record},
+                maxlen=_STREAM_MAXLEN,
+                approximate=True
+            )
+        pipe.execute()
     
     def log_security_event(
         self,
@@ -74,30 +191,44 @@ class SecurityAuditLogger:
             success: Whether the operation was successful
             error_message: Error message for failed operations
         """
-        event_data = {
-            "timestamp": get_current_utc_time().isoformat(),
-            "event_type": event_type.value,
-            "success": success,
-            "user_email": user_email,
-            "user_id": user_id,
-            "ip_address": ip_address,
-            "user_agent": user_agent,
-            "error_message": error_message,
-            "additional_data": additional_data or {}
-        }
-        
-        # Remove None values for cleaner logs
-        event_data = {k: v for k, v in event_data.items() if v is not None}
+        template = None if additional_data else _TEMPLATES.get((event_type, success))
+        if template is not None:
+            values = (user_email, user_id, ip_address, user_agent, error_message)
+            record = template.format_map({
+                "ts": get_current_utc_time().isoformat(),
+                "rest": "".join(
+                    f", \"{field}\": {json.dumps(value)}"
+                    for field, value in zip(_OPTIONAL_FIELDS, values)
+                    if value is not None
+                )
+            })
+        else:
+            event_data = {
+                "timestamp": get_current_utc_time().isoformat(),
+                "event_type": event_type.value,
+                "success": success,
+                "user_email": user_email,
+                "user_id": user_id,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "error_message": error_message,
+                "additional_data": additional_data or {}
+            }
+            
+            # Remove None values for cleaner logs
+            event_data = {k: v for k, v in event_data.items() if v is not None}
+            record = json.dumps(event_data)
         
         # Log at appropriate level based on event type and success
-        if not success or event_type in [
-            SecurityEventType.RATE_LIMIT_EXCEEDED,
-            SecurityEventType.ACCOUNT_LOCKED,
-            SecurityEventType.SUSPICIOUS_ACTIVITY
-        ]:
-            self.logger.warning(f"SECURITY_EVENT: {json.dumps(event_data)}")
+        if not success or event_type in _WARNING_EVENTS:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        
+        if self._flush_task is not None:
+            self._buffer.append((level, record))
         else:
-            self.logger.info(f"SECURITY_EVENT: {json.dumps(event_data)}")
+            self.logger.log(level, f"SECURITY_EVENT: {record}")
     
     def log_login_attempt(
         self,
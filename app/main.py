@@ -1,9 +1,12 @@
 """
 The Plugs - Enterprise FastAPI Application
 """
+import re
+import json
 import time
+import asyncio
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Optional
 import uuid
 
 from fastapi import FastAPI, Request, Response, status
@@ -11,18 +14,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError, HTTPException
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
 
 from app.config.settings import settings
 from app.config.database import db_config
 from app.config.redis import redis_config
 from app.config.security import cors_config
-from app.config.logging import setup_logging, set_correlation_id, get_correlation_id, log_request
+from app.config.logging import (
+    setup_logging, bind_correlation_id, reset_correlation_id, get_correlation_id, log_request
+)
 from app.core.exceptions import BaseApplicationException
+from app.core.health import cached_db_health, cached_redis_health
+from app.core.rate_limiter import rate_limiter
+from app.core.security_logger import security_audit_logger
 from app.api.router import api_router
-from app.utils.helpers import get_client_ip
+from app.utils.datetime import bind_request_now, reset_request_now
+from app.utils.helpers import get_client_ip_asgi, header_get
 
 # Setup logging first
 if not settings.is_testing:
@@ -30,58 +40,164 @@ if not settings.is_testing:
 
 logger = logging.getLogger(__name__)
 
+# Security headers added to every HTTP response, encoded once at import time
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+]
+if settings.is_production:
+    _SECURITY_HEADERS.append(
+        (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
+    )
+
+# Upstream correlation IDs are reused only if they look like a sane token
+_CORRELATION_ID_RE = re.compile(rb"[A-Za-z0-9._-]{1,128}")
+_CORRELATION_HEADERS = (b"x-correlation-id", b"x-request-id")
+
+# Probe and landing endpoints hit by load balancers, not worth logging
+_NO_LOG_PATHS = frozenset({"/health", "/metrics", "/"})
+
+
+def _get_upstream_correlation_id(headers) -> Optional[bytes]:
+    """Return a valid X-Correlation-ID / X-Request-ID from raw ASGI headers."""
+    request_id = None
+    for name, value in headers:
+        if name in _CORRELATION_HEADERS and _CORRELATION_ID_RE.fullmatch(value):
+            if name == b"x-correlation-id":
+                return value
+            request_id = request_id or value
+    return request_id
+
+# Reused for every error body; json.dumps builds a fresh encoder on each call
+# whenever non-default options are passed
+_ERROR_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    allow_nan=False,
+    separators=(",", ":"),
+    default=str
+)
+
+
+def _error_response(status_code: int, error: dict) -> Response:
+    """Render an error payload as a JSON response without re-encoding passes."""
+    return Response(
+        content=_ERROR_ENCODER.encode({"error": error}).encode("utf-8"),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def _get_url_str(scope: Scope) -> str:
+    """Build the request path and query string once, cached in the scope state."""
+    state = scope.setdefault("state", {})
+    url_str = state.get("url_str")
+    if url_str is None:
+        query_string = scope.get("query_string", b"")
+        url_str = scope["path"]
+        if query_string:
+            url_str = f"{url_str}?{query_string.decode('latin-1')}"
+        state["url_str"] = url_str
+    return url_str
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests and responses."""
+
+class ObservabilityMiddleware:
+    """
+    Middleware for security headers plus HTTP request/response logging.
+    
+    Both concerns share a single send wrapper so each request pays for one
+    middleware hop instead of two.
+    """
+    
+    __slots__ = ("app",)
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next):
-        # Set correlation ID for request tracking
-        correlation_id = str(uuid.uuid4())
-        set_correlation_id(correlation_id)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["path"] in _NO_LOG_PATHS:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Add security headers
+                    message["headers"] = list(message.get("headers", ())) + _SECURITY_HEADERS
+                await send(message)
+            
+            await self.app(scope, receive, send_with_headers)
+            return
+        
+        method = scope["method"]
+        url_str = _get_url_str(scope)
+        
+        # Set correlation ID for request tracking, reusing the caller's if given
+        correlation_bytes = _get_upstream_correlation_id(scope["headers"])
+        if correlation_bytes is None:
+            correlation_id = uuid.uuid4().hex
+            correlation_bytes = correlation_id.encode("latin-1")
+        else:
+            correlation_id = correlation_bytes.decode("latin-1")
+        correlation_token = bind_correlation_id(correlation_id)
+        # The context variable is reset before ServerErrorMiddleware runs the 500 handler
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+        now_token = bind_request_now()
+        response_headers = _SECURITY_HEADERS + [
+            (b"x-correlation-id", correlation_bytes),
+            (b"x-request-id", correlation_bytes),
+        ]
         
-        # Add correlation ID to response headers
-        start_time = time.time()
-        client_ip = get_client_ip(dict(request.headers))
+        start_ns = time.monotonic_ns()
+        client_ip = get_client_ip_asgi(scope["headers"], scope.get("client"))
         
         # Log request start
         logger.info(
-            f"Request started: {request.method} {request.url.path}",
+            "Request started: %s %s", method, scope["path"],
             extra={
-                "method": request.method,
-                "url": str(request.url),
+                "method": method,
+                "url": url_str,
                 "client_ip": client_ip,
-                "user_agent": request.headers.get("user-agent", ""),
+                "user_agent": (header_get(scope["headers"], b"user-agent") or b"").decode("latin-1"),
                 "correlation_id": correlation_id
             }
         )
         
-        try:
-            response = await call_next(request)
-            duration = time.time() - start_time
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
             
-            # Add correlation ID to response headers
-            response.headers["X-Correlation-ID"] = correlation_id
-            response.headers["X-Request-ID"] = correlation_id
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                
+                # Add security and correlation ID headers
+                message["headers"] = list(message.get("headers", ())) + response_headers
             
-            # Log request completion
-            log_request(
-                method=request.method,
-                url=str(request.url),
-                status_code=response.status_code,
-                duration=duration,
-                client_ip=client_ip,
-                correlation_id=correlation_id
-            )
+            await send(message)
             
-            return response
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Log request completion
+                log_request(
+                    method=method,
+                    url=url_str,
+                    status_code=status_code,
+                    duration=(time.monotonic_ns() - start_ns) / 1e9,
+                    client_ip=client_ip,
+                    correlation_id=correlation_id
+                )
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = (time.monotonic_ns() - start_ns) / 1e9
             logger.error(
-                f"Request failed: {request.method} {request.url.path}",
+                "Request failed: %s %s", method, scope["path"],
                 extra={
-                    "method": request.method,
-                    "url": str(request.url),
+                    "method": method,
+                    "url": url_str,
                     "client_ip": client_ip,
                     "error": str(e),
                     "duration": duration,
@@ -90,24 +206,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 exc_info=e
             )
             raise
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware for adding security headers."""
-    
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        if settings.is_production:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
         
-        return response
+        finally:
+            # Don't leak the ID or clock into background tasks spawned by the handler
+            reset_request_now(now_token)
+            reset_correlation_id(correlation_token)
 
 
 @asynccontextmanager
@@ -117,30 +220,39 @@ async def lifespan(app: FastAPI):
     logger.info("Starting The Plugs API application")
     
     try:
-        # Test database connection
-        if db_config.health_check():
+        # Test database connection; the result seeds the /health cache so the
+        # first readiness probe doesn't repeat the round-trip
+        if await cached_db_health():
             logger.info("Database connection established")
         else:
             logger.error("Database connection failed")
             raise RuntimeError("Cannot connect to database")
         
         # Test Redis connection
-        if redis_config.health_check():
+        if await cached_redis_health():
             logger.info("Redis connection established")
         else:
             logger.error("Redis connection failed")
             raise RuntimeError("Cannot connect to Redis")
         
+        # Share rate-limit state with other workers
+        rate_limiter.start_event_subscription()
+        
+        # Batch security audit events into the Redis Stream
+        security_audit_logger.start_stream_shipping()
+        
         logger.info("Application startup completed successfully")
         
         yield
         
     except Exception as e:
-        logger.error(f"Application startup failed: {e}")
+        logger.error("Application startup failed: %s", e)
         raise
     finally:
         # Shutdown
         logger.info("Shutting down The Plugs API application")
+        rate_limiter.stop_event_subscription()
+        await security_audit_logger.stop_stream_shipping()
 
 
 def create_application() -> FastAPI:
@@ -175,8 +287,7 @@ def create_application() -> FastAPI:
         )
     
     # Add custom middleware
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(ObservabilityMiddleware)
     
     # Include API routes
     app.include_router(api_router, prefix="/api")
@@ -184,20 +295,37 @@ def create_application() -> FastAPI:
     # Configure exception handlers
     configure_exception_handlers(app)
     
+    # Pre-serialized healthy body, only the timestamp varies between calls
+    healthy_prefix = b'{"status":"healthy","timestamp":'
+    healthy_suffix = b"," + json.dumps({
+        "version": settings.app_version,
+        "environment": settings.environment.value,
+        "services": {
+            "database": "healthy",
+            "redis": "healthy"
+        }
+    }, ensure_ascii=False, separators=(",", ":"))[1:].encode("utf-8")
+    
     # Add health check endpoint
     @app.get("/health", tags=["Health"])
     async def health_check():
         """Health check endpoint."""
         try:
-            # Check database
-            db_healthy = db_config.health_check()
-            
-            # Check Redis
-            redis_healthy = redis_config.health_check()
+            # Check database and Redis concurrently
+            db_healthy, redis_healthy = await asyncio.gather(
+                cached_db_health(),
+                cached_redis_health()
+            )
             
             # Overall health
             healthy = db_healthy and redis_healthy
             
+            if healthy:
+                return Response(
+                    content=healthy_prefix + repr(time.time()).encode("ascii") + healthy_suffix,
+                    media_type="application/json"
+                )
+            
             health_data = {
                 "status": "healthy" if healthy else "unhealthy",
                 "timestamp": time.time(),
@@ -213,7 +341,7 @@ def create_application() -> FastAPI:
             return JSONResponse(content=health_data, status_code=status_code)
             
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return JSONResponse(
                 content={
                     "status": "unhealthy",
@@ -228,8 +356,10 @@ def create_application() -> FastAPI:
     async def metrics():
         """Basic metrics endpoint."""
         try:
-            db_info = db_config.get_connection_info()
-            redis_info = redis_config.get_connection_info()
+            db_info, redis_info = await asyncio.gather(
+                run_in_threadpool(db_config.get_connection_info),
+                run_in_threadpool(redis_config.get_connection_info)
+            )
             
             return {
                 "database": db_info,
@@ -237,24 +367,26 @@ def create_application() -> FastAPI:
                 "correlation_id": get_correlation_id()
             }
         except Exception as e:
-            logger.error(f"Metrics collection failed: {e}")
+            logger.error("Metrics collection failed: %s", e)
             return JSONResponse(
                 content={"error": "Metrics unavailable"},
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE
             )
     
-    # Root endpoint
-    @app.get("/", tags=["Root"])
+    # Root endpoint, static for the lifetime of the app so serialized once
+    root_body = json.dumps({
+        "name": settings.app_name,
+        "version": settings.app_version,
+        "environment": settings.environment.value,
+        "docs_url": "/docs" if not settings.is_production else None,
+        "health_url": "/health",
+        "api_url": "/api"
+    }, separators=(",", ":")).encode("utf-8")
+    
+    @app.get("/", tags=["Root"], response_class=Response)
     async def root():
         """Root endpoint with API information."""
-        return {
-            "name": settings.app_name,
-            "version": settings.app_version,
-            "environment": settings.environment.value,
-            "docs_url": "/docs" if not settings.is_production else None,
-            "health_url": "/health",
-            "api_url": "/api"
-        }
+        return Response(content=root_body, media_type="application/json")
     
     return app
 
@@ -265,33 +397,35 @@ def configure_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(BaseApplicationException)
     async def application_exception_handler(request: Request, exc: BaseApplicationException):
         """Handle custom application exceptions."""
+        correlation_id = get_correlation_id()
+        
         logger.error(
-            f"Application exception: {exc.message}",
+            "Application exception: %s", exc.message,
             extra={
                 "error_code": exc.error_code,
                 "details": exc.details,
-                "url": str(request.url),
+                "url": _get_url_str(request.scope),
                 "method": request.method,
-                "correlation_id": get_correlation_id()
+                "correlation_id": correlation_id
             }
         )
         
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": {
-                    "code": exc.error_code,
-                    "message": exc.message,
-                    "details": exc.details,
-                    "timestamp": time.time(),
-                    "correlation_id": get_correlation_id()
-                }
+        return _error_response(
+            status.HTTP_400_BAD_REQUEST,
+            {
+                "code": exc.error_code,
+                "message": exc.message,
+                "details": exc.details,
+                "timestamp": time.time(),
+                "correlation_id": correlation_id
             }
         )
     
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Handle request validation errors."""
+        correlation_id = get_correlation_id()
+        
         # Convert errors to JSON-serializable format
         serializable_errors = []
         for error in exc.errors():
@@ -304,111 +438,112 @@ def configure_exception_handlers(app: FastAPI) -> None:
             serializable_errors.append(serializable_error)
         
         logger.warning(
-            f"Validation error: {str(exc)}",
+            "Validation error: %s", exc,
             extra={
                 "errors": serializable_errors,
-                "url": str(request.url),
+                "url": _get_url_str(request.scope),
                 "method": request.method,
-                "correlation_id": get_correlation_id()
+                "correlation_id": correlation_id
             }
         )
         
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": "Request validation failed",
-                    "details": serializable_errors,
-                    "timestamp": time.time(),
-                    "correlation_id": get_correlation_id()
-                }
+        return _error_response(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            {
+                "code": "VALIDATION_ERROR",
+                "message": "Request validation failed",
+                "details": serializable_errors,
+                "timestamp": time.time(),
+                "correlation_id": correlation_id
             }
         )
     
     @app.exception_handler(ValueError)
     async def value_error_handler(request: Request, exc: ValueError):
         """Handle ValueError exceptions (e.g., from Pydantic validators)."""
+        correlation_id = get_correlation_id()
+        
         logger.warning(
-            f"Value error: {str(exc)}",
+            "Value error: %s", exc,
             extra={
-                "url": str(request.url),
+                "url": _get_url_str(request.scope),
                 "method": request.method,
-                "correlation_id": get_correlation_id()
+                "correlation_id": correlation_id
             }
         )
         
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": str(exc),
-                    "timestamp": time.time(),
-                    "correlation_id": get_correlation_id()
-                }
+        return _error_response(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            {
+                "code": "VALIDATION_ERROR",
+                "message": str(exc),
+                "timestamp": time.time(),
+                "correlation_id": correlation_id
             }
         )
     
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle HTTP exceptions."""
+        correlation_id = get_correlation_id()
+        
         logger.warning(
-            f"HTTP exception: {exc.detail}",
+            "HTTP exception: %s", exc.detail,
             extra={
                 "status_code": exc.status_code,
-                "url": str(request.url),
+                "url": _get_url_str(request.scope),
                 "method": request.method,
-                "correlation_id": get_correlation_id()
+                "correlation_id": correlation_id
             }
         )
         
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "error": {
-                    "code": "HTTP_ERROR",
-                    "message": exc.detail,
-                    "timestamp": time.time(),
-                    "correlation_id": get_correlation_id()
-                }
+        return _error_response(
+            exc.status_code,
+            {
+                "code": "HTTP_ERROR",
+                "message": exc.detail,
+                "timestamp": time.time(),
+                "correlation_id": correlation_id
             }
         )
     
     @app.exception_handler(StarletteHTTPException)
     async def starlette_exception_handler(request: Request, exc: StarletteHTTPException):
         """Handle Starlette HTTP exceptions."""
+        correlation_id = get_correlation_id()
+        
         logger.warning(
-            f"Starlette HTTP exception: {exc.detail}",
+            "Starlette HTTP exception: %s", exc.detail,
             extra={
                 "status_code": exc.status_code,
-                "url": str(request.url),
+                "url": _get_url_str(request.scope),
                 "method": request.method,
-                "correlation_id": get_correlation_id()
+                "correlation_id": correlation_id
             }
         )
         
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "error": {
-                    "code": "HTTP_ERROR",
-                    "message": exc.detail,
-                    "timestamp": time.time(),
-                    "correlation_id": get_correlation_id()
-                }
+        return _error_response(
+            exc.status_code,
+            {
+                "code": "HTTP_ERROR",
+                "message": exc.detail,
+                "timestamp": time.time(),
+                "correlation_id": correlation_id
             }
         )
     
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle unexpected exceptions."""
+        # Runs outside the observability middleware, after its context has been reset
+        correlation_id = get_correlation_id() or request.scope.get("state", {}).get("correlation_id")
+        
         logger.error(
-            f"Unexpected error: {str(exc)}",
+            "Unexpected error: %s", exc,
             extra={
-                "url": str(request.url),
+                "url": _get_url_str(request.scope),
                 "method": request.method,
-                "correlation_id": get_correlation_id()
+                "correlation_id": correlation_id
             },
             exc_info=exc
         )
@@ -416,15 +551,13 @@ def configure_exception_handlers(app: FastAPI) -> None:
         # Don't expose internal errors in production
         error_message = "Internal server error" if settings.is_production else str(exc)
         
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": error_message,
-                    "timestamp": time.time(),
-                    "correlation_id": get_correlation_id()
-                }
+        return _error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {
+                "code": "INTERNAL_ERROR",
+                "message": error_message,
+                "timestamp": time.time(),
+                "correlation_id": correlation_id
             }
         )
 
@@ -432,4 +565,4 @@ def configure_exception_handlers(app: FastAPI) -> None:
 # Create application instance
 app = create_application()
 
-# Run with: uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+# Run with: uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
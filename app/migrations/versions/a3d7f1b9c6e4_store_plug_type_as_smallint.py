@@ -0,0 +1,96 @@
+"""store plug type as smallint
+
+Revision ID: a3d7f1b9c6e4
+Revises: f8c2a6e9d4b1
+Create Date: 2025-10-22 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3d7f1b9c6e4'
+down_revision = 'f8c2a6e9d4b1'
+branch_labels = None
+depends_on = None
+
+
+# Mirrors app.models.plug.PLUG_TYPE_CODES
+PLUG_TYPE_CODES = {'TARGET': 1, 'CONTACT': 2}
+
+REFRESH_COUNTS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION refresh_event_plug_counts(p_event_id uuid) RETURNS void AS $$
+        UPDATE events e
+        SET target_count = c.targets,
+            contact_count = c.contacts
+        FROM (
+            SELECT count(*) FILTER (WHERE p.plug_type = {target}) AS targets,
+                   count(*) FILTER (WHERE p.plug_type = {contact}) AS contacts
+            FROM event_plugs ep
+            JOIN plugs p ON p.id = ep.plug_id
+            WHERE ep.event_id = p_event_id
+              AND NOT ep.is_deleted
+              AND NOT p.is_deleted
+        ) c
+        WHERE e.id = p_event_id;
+    $$ LANGUAGE sql;
+"""
+
+# A column named in a trigger's UPDATE OF / WHEN cannot change type
+CREATE_PLUGS_TRIGGER = """
+    CREATE TRIGGER trg_plugs_refresh_event_counts
+    AFTER UPDATE OF plug_type, is_deleted ON plugs
+    FOR EACH ROW
+    WHEN (OLD.plug_type IS DISTINCT FROM NEW.plug_type OR OLD.is_deleted IS DISTINCT FROM NEW.is_deleted)
+    EXECUTE FUNCTION plugs_refresh_event_counts();
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_plugs_refresh_event_counts ON plugs")
+    op.drop_constraint('check_plug_type', 'plugs', type_='check')
+    
+    cases = " ".join(f"WHEN '{name}' THEN {code}" for name, code in PLUG_TYPE_CODES.items())
+    op.alter_column(
+        'plugs',
+        'plug_type',
+        existing_type=sa.String(length=16),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=f'CASE plug_type {cases} END'
+    )
+    op.create_check_constraint(
+        'check_plug_type',
+        'plugs',
+        f"plug_type IN ({', '.join(str(code) for code in PLUG_TYPE_CODES.values())})"
+    )
+    
+    op.execute(REFRESH_COUNTS_FUNCTION.format(
+        target=PLUG_TYPE_CODES['TARGET'],
+        contact=PLUG_TYPE_CODES['CONTACT']
+    ))
+    op.execute(CREATE_PLUGS_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_plugs_refresh_event_counts ON plugs")
+    op.drop_constraint('check_plug_type', 'plugs', type_='check')
+    
+    cases = " ".join(f"WHEN {code} THEN '{name}'" for name, code in PLUG_TYPE_CODES.items())
+    op.alter_column(
+        'plugs',
+        'plug_type',
+        existing_type=sa.SmallInteger(),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using=f'CASE plug_type {cases} END'
+    )
+    op.create_check_constraint(
+        'check_plug_type',
+        'plugs',
+        f"plug_type IN ({', '.join(repr(name) for name in PLUG_TYPE_CODES)})"
+    )
+    
+    op.execute(REFRESH_COUNTS_FUNCTION.format(target="'TARGET'", contact="'CONTACT'"))
+    op.execute(CREATE_PLUGS_TRIGGER)
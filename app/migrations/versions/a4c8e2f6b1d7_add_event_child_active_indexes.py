@@ -0,0 +1,46 @@
+"""add event child active indexes
+
+Revision ID: a4c8e2f6b1d7
+Revises: f6b2d8e4a9c3
+Create Date: 2025-10-21 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4c8e2f6b1d7'
+down_revision = 'f6b2d8e4a9c3'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose non-deleted rows are looked up by event_id
+ACTIVE_TABLES = ['event_expenses', 'event_media', 'event_plugs']
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in ACTIVE_TABLES:
+            op.create_index(
+                f'ix_{table}_active',
+                table,
+                ['event_id'],
+                unique=False,
+                postgresql_where=sa.text('is_deleted = false'),
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ACTIVE_TABLES:
+            op.drop_index(
+                f'ix_{table}_active',
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
@@ -0,0 +1,43 @@
+"""add users lower email index
+
+Revision ID: a8e2c6f4b3d7
+Revises: f3c7a1e5d9b2
+Create Date: 2025-10-22 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8e2c6f4b3d7'
+down_revision = 'f3c7a1e5d9b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Normalize stored addresses to match the model's write-time normalization;
+    # fails on case-only duplicates, which must be merged by hand first
+    op.execute("UPDATE users SET email = lower(btrim(email)) WHERE email <> lower(btrim(email))")
+    
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_lower',
+            'users',
+            [sa.text('lower(email)')],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_email_lower',
+            table_name='users',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,25 @@
+"""drop event expense amount index
+
+Revision ID: a9c4e7f1d3b5
+Revises: f2b7d4e9a1c8
+Create Date: 2025-10-20 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c4e7f1d3b5'
+down_revision = 'f2b7d4e9a1c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # No query filters or orders expenses by amount; the index only taxed writes
+    op.drop_index('ix_event_expenses_amount', table_name='event_expenses', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('ix_event_expenses_amount', 'event_expenses', ['amount'], unique=False)
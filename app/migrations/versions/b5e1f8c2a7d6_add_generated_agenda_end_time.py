@@ -0,0 +1,37 @@
+"""add generated agenda end time
+
+Revision ID: b5e1f8c2a7d6
+Revises: a9c4e7f1d3b5
+Create Date: 2025-10-20 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e1f8c2a7d6'
+down_revision = 'a9c4e7f1d3b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'event_agendas',
+        sa.Column(
+            'end_time',
+            sa.DateTime(timezone=True),
+            sa.Computed(
+                "((start_time AT TIME ZONE 'UTC') + make_interval(mins => duration_minutes)) AT TIME ZONE 'UTC'",
+                persisted=True
+            ),
+            nullable=False
+        )
+    )
+    op.create_index(op.f('ix_event_agendas_end_time'), 'event_agendas', ['end_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_event_agendas_end_time'), table_name='event_agendas')
+    op.drop_column('event_agendas', 'end_time')
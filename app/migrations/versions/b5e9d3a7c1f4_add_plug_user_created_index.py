@@ -0,0 +1,40 @@
+"""add plug user created index
+
+Revision ID: b5e9d3a7c1f4
+Revises: a3d7f1b9c6e4
+Create Date: 2025-10-22 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e9d3a7c1f4'
+down_revision = 'a3d7f1b9c6e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_plugs_user_created',
+            'plugs',
+            ['user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_plugs_user_created',
+            table_name='plugs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,65 @@
+"""add generated full name columns
+
+Revision ID: b6f1d3a9e4c8
+Revises: a8e2c6f4b3d7
+Create Date: 2025-10-22 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6f1d3a9e4c8'
+down_revision = 'a8e2c6f4b3d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'plugs',
+        sa.Column(
+            'full_name',
+            sa.String(length=65),
+            sa.Computed("btrim(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))", persisted=True),
+            nullable=False
+        )
+    )
+    op.add_column(
+        'users',
+        sa.Column(
+            'full_name',
+            sa.String(length=65),
+            sa.Computed("first_name || ' ' || last_name", persisted=True),
+            nullable=False
+        )
+    )
+    
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_plugs_full_name_trgm',
+            'plugs',
+            ['full_name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_plugs_full_name_trgm',
+            table_name='plugs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+    
+    op.drop_column('users', 'full_name')
+    op.drop_column('plugs', 'full_name')
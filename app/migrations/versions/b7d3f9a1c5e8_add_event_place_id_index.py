@@ -0,0 +1,40 @@
+"""add event place_id index
+
+Revision ID: b7d3f9a1c5e8
+Revises: a4c8e2f6b1d7
+Create Date: 2025-10-21 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3f9a1c5e8'
+down_revision = 'a4c8e2f6b1d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_events_place_id',
+            'events',
+            [sa.text("(location_metadata ->> 'place_id')")],
+            unique=False,
+            postgresql_where=sa.text("location_metadata ? 'place_id'"),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_events_place_id',
+            table_name='events',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,46 @@
+"""add event child created_at brin indexes
+
+Revision ID: c2e6a8d4f7b9
+Revises: b7d3f9a1c5e8
+Create Date: 2025-10-21 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2e6a8d4f7b9'
+down_revision = 'b7d3f9a1c5e8'
+branch_labels = None
+depends_on = None
+
+
+# Append-only tables whose rows arrive in created_at order
+BRIN_TABLES = ['event_media', 'event_plug_media', 'event_expenses']
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.create_index(
+                f'ix_{table}_created_brin',
+                table,
+                ['created_at'],
+                unique=False,
+                postgresql_using='brin',
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.drop_index(
+                f'ix_{table}_created_brin',
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
@@ -0,0 +1,39 @@
+"""use C collation for expense category and plug priority
+
+Revision ID: c3d9a6e4f2b1
+Revises: b5e1f8c2a7d6
+Create Date: 2025-10-20 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d9a6e4f2b1'
+down_revision = 'b5e1f8c2a7d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Dependent indexes are rebuilt by Postgres with the new collation
+    op.alter_column('event_expenses', 'category',
+                    existing_type=sa.String(length=64),
+                    type_=sa.String(length=64, collation='C'),
+                    existing_nullable=False)
+    op.alter_column('event_plugs', 'priority',
+                    existing_type=sa.String(length=32),
+                    type_=sa.String(length=32, collation='C'),
+                    existing_nullable=True)
+
+
+def downgrade() -> None:
+    op.alter_column('event_plugs', 'priority',
+                    existing_type=sa.String(length=32, collation='C'),
+                    type_=sa.String(length=32),
+                    existing_nullable=True)
+    op.alter_column('event_expenses', 'category',
+                    existing_type=sa.String(length=64, collation='C'),
+                    type_=sa.String(length=64),
+                    existing_nullable=False)
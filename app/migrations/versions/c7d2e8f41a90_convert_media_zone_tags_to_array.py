@@ -0,0 +1,55 @@
+"""convert media zone tags to array
+
+Revision ID: c7d2e8f41a90
+Revises: a1b2c3d4e5f6
+Create Date: 2025-10-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2e8f41a90'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Split the comma-separated tags into a trimmed text array, dropping empty entries
+    op.alter_column(
+        'event_media_zones',
+        'tags',
+        existing_type=sa.Text(),
+        type_=postgresql.ARRAY(sa.Text()),
+        existing_nullable=True,
+        comment='Tags applied to all media in this zone',
+        existing_comment='Comma-separated tags applied to all media in this zone',
+        postgresql_using=(
+            "CASE WHEN tags IS NULL OR btrim(tags) = '' THEN NULL "
+            "ELSE array_remove(regexp_split_to_array(btrim(tags), '\\s*,\\s*'), '') END"
+        )
+    )
+    op.create_index(
+        'ix_event_media_zones_tags',
+        'event_media_zones',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_event_media_zones_tags', table_name='event_media_zones')
+    op.alter_column(
+        'event_media_zones',
+        'tags',
+        existing_type=postgresql.ARRAY(sa.Text()),
+        type_=sa.Text(),
+        existing_nullable=True,
+        comment='Comma-separated tags applied to all media in this zone',
+        existing_comment='Tags applied to all media in this zone',
+        postgresql_using="array_to_string(tags, ',')"
+    )
@@ -0,0 +1,83 @@
+"""add plug search text trigram index
+
+Revision ID: c8f2a4d6e1b9
+Revises: b5e9d3a7c1f4
+Create Date: 2025-10-22 15:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8f2a4d6e1b9'
+down_revision = 'b5e9d3a7c1f4'
+branch_labels = None
+depends_on = None
+
+
+# Mirrors app.models.plug.SEARCH_TEXT_EXPRESSION
+SEARCH_TEXT_EXPRESSION = " || E'\\n' || ".join((
+    "coalesce(first_name, '') || ' ' || coalesce(last_name, '')",
+    "coalesce(company, '')",
+    "coalesce(email, '')",
+    "coalesce(job_title, '')",
+    "coalesce(network_type, '')",
+    "coalesce(business_type, '')",
+    "coalesce(connect_reason, '')",
+))
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        'plugs',
+        sa.Column(
+            'search_text',
+            sa.Text(),
+            sa.Computed(SEARCH_TEXT_EXPRESSION, persisted=True),
+            nullable=False
+        )
+    )
+    
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_plugs_search_text_trgm',
+            'plugs',
+            ['search_text'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        # Name search is now served by the combined index
+        op.drop_index(
+            'ix_plugs_full_name_trgm',
+            table_name='plugs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_plugs_full_name_trgm',
+            'plugs',
+            ['full_name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_plugs_search_text_trgm',
+            table_name='plugs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+    
+    op.drop_column('plugs', 'search_text')
@@ -0,0 +1,71 @@
+"""store plug enums as varchar with check
+
+Revision ID: c9a5e1b7d2f6
+Revises: b6f1d3a9e4c8
+Create Date: 2025-10-22 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9a5e1b7d2f6'
+down_revision = 'b6f1d3a9e4c8'
+branch_labels = None
+depends_on = None
+
+
+# (column, native enum type, labels, check constraint name)
+ENUM_COLUMNS = [
+    ('plug_type', 'plugtype', ('TARGET', 'CONTACT'), 'check_plug_type'),
+    ('priority', 'priority', ('LOW', 'MEDIUM', 'HIGH', 'URGENT'), 'check_priority'),
+]
+
+# Trigger from f6b2d8e4a9c3; a column named in UPDATE OF / WHEN cannot change type
+CREATE_PLUGS_TRIGGER = """
+    CREATE TRIGGER trg_plugs_refresh_event_counts
+    AFTER UPDATE OF plug_type, is_deleted ON plugs
+    FOR EACH ROW
+    WHEN (OLD.plug_type IS DISTINCT FROM NEW.plug_type OR OLD.is_deleted IS DISTINCT FROM NEW.is_deleted)
+    EXECUTE FUNCTION plugs_refresh_event_counts();
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_plugs_refresh_event_counts ON plugs")
+    
+    for column, type_name, labels, constraint in ENUM_COLUMNS:
+        op.alter_column(
+            'plugs',
+            column,
+            existing_type=postgresql.ENUM(*labels, name=type_name),
+            type_=sa.String(length=16),
+            postgresql_using=f'{column}::text'
+        )
+        op.create_check_constraint(
+            constraint,
+            'plugs',
+            f"{column} IN ({', '.join(repr(label) for label in labels)})"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+    
+    op.execute(CREATE_PLUGS_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_plugs_refresh_event_counts ON plugs")
+    
+    for column, type_name, labels, constraint in ENUM_COLUMNS:
+        op.drop_constraint(constraint, 'plugs', type_='check')
+        postgresql.ENUM(*labels, name=type_name).create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            'plugs',
+            column,
+            existing_type=sa.String(length=16),
+            type_=postgresql.ENUM(*labels, name=type_name),
+            postgresql_using=f'{column}::{type_name}'
+        )
+    
+    op.execute(CREATE_PLUGS_TRIGGER)
@@ -0,0 +1,37 @@
+"""use text for plug profile picture
+
+Revision ID: d1f7b3c5a8e2
+Revises: c9a5e1b7d2f6
+Create Date: 2025-10-22 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1f7b3c5a8e2'
+down_revision = 'c9a5e1b7d2f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # varchar -> text is binary coercible: catalog-only, no table rewrite
+    op.alter_column(
+        'plugs',
+        'profile_picture',
+        existing_type=sa.String(length=500),
+        type_=sa.Text(),
+        existing_nullable=True
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'plugs',
+        'profile_picture',
+        existing_type=sa.Text(),
+        type_=sa.String(length=500),
+        existing_nullable=True
+    )
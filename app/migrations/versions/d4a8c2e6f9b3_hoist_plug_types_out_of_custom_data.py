@@ -0,0 +1,34 @@
+"""hoist plug types out of custom data
+
+Revision ID: d4a8c2e6f9b3
+Revises: c8f2a4d6e1b9
+Create Date: 2025-10-22 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8c2e6f9b3'
+down_revision = 'c8f2a4d6e1b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fill empty columns from custom_data and strip the duplicated keys in one pass
+    op.execute(
+        """
+        UPDATE plugs
+        SET network_type = coalesce(network_type, left(custom_data->>'network_type', 64)),
+            business_type = coalesce(business_type, left(custom_data->>'business_type', 64)),
+            custom_data = nullif(custom_data - 'network_type' - 'business_type', '{}'::jsonb)
+        WHERE custom_data ?| array['network_type', 'business_type']
+        """
+    )
+
+
+def downgrade() -> None:
+    # The keys only duplicated the columns; nothing to restore
+    pass
@@ -0,0 +1,56 @@
+"""use double precision event coordinates
+
+Revision ID: d4f1a9b7c3e2
+Revises: c7d2e8f41a90
+Create Date: 2025-10-20 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f1a9b7c3e2'
+down_revision = 'c7d2e8f41a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_events_longitude', table_name='events')
+    op.drop_index('ix_events_latitude', table_name='events')
+    
+    op.alter_column('events', 'latitude',
+                    existing_type=sa.Numeric(precision=10, scale=8),
+                    type_=sa.Double(),
+                    existing_nullable=True)
+    op.alter_column('events', 'longitude',
+                    existing_type=sa.Numeric(precision=11, scale=8),
+                    type_=sa.Double(),
+                    existing_nullable=True)
+    
+    # GiST index over the built-in point type for spatial range queries
+    op.create_index(
+        'ix_events_location',
+        'events',
+        [sa.text('point(longitude, latitude)')],
+        unique=False,
+        postgresql_using='gist',
+        postgresql_where=sa.text('latitude IS NOT NULL AND longitude IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_location', table_name='events')
+    
+    op.alter_column('events', 'longitude',
+                    existing_type=sa.Double(),
+                    type_=sa.Numeric(precision=11, scale=8),
+                    existing_nullable=True)
+    op.alter_column('events', 'latitude',
+                    existing_type=sa.Double(),
+                    type_=sa.Numeric(precision=10, scale=8),
+                    existing_nullable=True)
+    
+    op.create_index('ix_events_latitude', 'events', ['latitude'], unique=False)
+    op.create_index('ix_events_longitude', 'events', ['longitude'], unique=False)
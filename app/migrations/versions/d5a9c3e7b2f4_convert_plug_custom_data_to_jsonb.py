@@ -0,0 +1,60 @@
+"""convert plug custom_data to jsonb
+
+Revision ID: d5a9c3e7b2f4
+Revises: c2e6a8d4f7b9
+Create Date: 2025-10-22 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a9c3e7b2f4'
+down_revision = 'c2e6a8d4f7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'plugs',
+        'custom_data',
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='custom_data::jsonb'
+    )
+    
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_plugs_custom_data',
+            'plugs',
+            ['custom_data'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'custom_data': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_plugs_custom_data',
+            table_name='plugs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+    
+    op.alter_column(
+        'plugs',
+        'custom_data',
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='custom_data::json'
+    )
@@ -0,0 +1,81 @@
+"""add event listing composite indexes
+
+Revision ID: d8f2b4a6c1e9
+Revises: c3d9a6e4f2b1
+Create Date: 2025-10-21 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8f2b4a6c1e9'
+down_revision = 'c3d9a6e4f2b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Rebuild the active-events index to also cover the created_at ordering
+        op.drop_index('ix_events_active', table_name='events', postgresql_concurrently=True, if_exists=True)
+        op.create_index(
+            'ix_events_active',
+            'events',
+            ['user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_events_user_start',
+            'events',
+            ['user_id', sa.text('start_date DESC')],
+            unique=False,
+            postgresql_include=['title'],
+            postgresql_concurrently=True
+        )
+        # Superseded by the composites leading with user_id
+        op.drop_index('ix_events_user_id', table_name='events', postgresql_concurrently=True, if_exists=True)
+        
+        # Cover amount so budget sums can be answered from the index
+        op.drop_index(
+            'ix_event_expenses_event_created',
+            table_name='event_expenses',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.create_index(
+            'ix_event_expenses_event_created',
+            'event_expenses',
+            ['event_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_include=['amount'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_event_expenses_event_created', table_name='event_expenses', postgresql_concurrently=True)
+        op.create_index(
+            'ix_event_expenses_event_created',
+            'event_expenses',
+            ['event_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        
+        op.create_index('ix_events_user_id', 'events', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_events_user_start', table_name='events', postgresql_concurrently=True)
+        op.drop_index('ix_events_active', table_name='events', postgresql_concurrently=True)
+        op.create_index(
+            'ix_events_active',
+            'events',
+            ['user_id'],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True
+        )
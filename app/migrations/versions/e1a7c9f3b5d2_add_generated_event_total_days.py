@@ -0,0 +1,37 @@
+"""add generated event total days
+
+Revision ID: e1a7c9f3b5d2
+Revises: d8f2b4a6c1e9
+Create Date: 2025-10-21 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1a7c9f3b5d2'
+down_revision = 'd8f2b4a6c1e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # timestamptz::date depends on the session TimeZone (STABLE); converting through
+    # UTC first keeps the expression IMMUTABLE as generated columns require
+    op.add_column(
+        'events',
+        sa.Column(
+            'total_days',
+            sa.Integer(),
+            sa.Computed(
+                "COALESCE(((end_date AT TIME ZONE 'UTC')::date - (start_date AT TIME ZONE 'UTC')::date) + 1, 0)",
+                persisted=True
+            ),
+            nullable=False
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'total_days')
@@ -0,0 +1,32 @@
+"""use lz4 compression for plug text columns
+
+Revision ID: e4b8d2f6c1a9
+Revises: d1f7b3c5a8e2
+Create Date: 2025-10-22 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b8d2f6c1a9'
+down_revision = 'd1f7b3c5a8e2'
+branch_labels = None
+depends_on = None
+
+
+# Free-form columns large enough to be TOASTed
+LZ4_COLUMNS = ['notes', 'connect_reason', 'custom_data']
+
+
+def upgrade() -> None:
+    # Requires PostgreSQL 14+ built with lz4; applies to values written from now on,
+    # existing values keep pglz until they are rewritten
+    for column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE plugs ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE plugs ALTER COLUMN {column} SET COMPRESSION pglz")
@@ -0,0 +1,36 @@
+"""move plug and user defaults to server
+
+Revision ID: e7c1b5f3a9d2
+Revises: d4a8c2e6f9b3
+Create Date: 2025-10-22 16:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7c1b5f3a9d2'
+down_revision = 'd4a8c2e6f9b3'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, existing type, server default); setting a default is catalog-only
+SERVER_DEFAULTS = [
+    ('plugs', 'plug_type', sa.SmallInteger(), sa.text('1')),
+    ('plugs', 'priority', sa.String(length=16), sa.text("'MEDIUM'")),
+    ('plugs', 'is_contact', sa.Boolean(), sa.text('false')),
+    ('users', 'timezone', sa.String(length=255), sa.text("'UTC'")),
+    ('users', 'is_active', sa.Boolean(), sa.text('true')),
+]
+
+
+def upgrade() -> None:
+    for table, column, existing_type, server_default in SERVER_DEFAULTS:
+        op.alter_column(table, column, existing_type=existing_type, server_default=server_default)
+
+
+def downgrade() -> None:
+    for table, column, existing_type, _ in SERVER_DEFAULTS:
+        op.alter_column(table, column, existing_type=existing_type, server_default=None)
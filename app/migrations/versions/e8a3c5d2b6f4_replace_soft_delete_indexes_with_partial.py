@@ -0,0 +1,64 @@
+"""replace soft delete indexes with partial indexes
+
+Revision ID: e8a3c5d2b6f4
+Revises: d4f1a9b7c3e2
+Create Date: 2025-10-20 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a3c5d2b6f4'
+down_revision = 'd4f1a9b7c3e2'
+branch_labels = None
+depends_on = None
+
+
+TABLES = [
+    'users',
+    'plugs',
+    'events',
+    'event_agendas',
+    'event_expenses',
+    'event_media_zones',
+    'event_media',
+    'event_plugs',
+    'event_plug_media',
+]
+
+# updated_at stays indexed on plugs, which orders recent activity by it
+DROPPED_COLUMNS = {
+    table: ['is_deleted', 'deleted_at'] + ([] if table == 'plugs' else ['updated_at'])
+    for table in TABLES
+}
+
+ACTIVE_INDEXES = {
+    'events': ['user_id'],
+    'plugs': ['user_id'],
+}
+
+
+def upgrade() -> None:
+    for table, columns in DROPPED_COLUMNS.items():
+        for column in columns:
+            op.execute(f'DROP INDEX IF EXISTS ix_{table}_{column}')
+    
+    for table, columns in ACTIVE_INDEXES.items():
+        op.create_index(
+            f'ix_{table}_active',
+            table,
+            columns,
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false')
+        )
+
+
+def downgrade() -> None:
+    for table in ACTIVE_INDEXES:
+        op.drop_index(f'ix_{table}_active', table_name=table)
+    
+    for table, columns in DROPPED_COLUMNS.items():
+        for column in columns:
+            op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
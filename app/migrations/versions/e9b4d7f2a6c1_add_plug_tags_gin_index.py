@@ -0,0 +1,40 @@
+"""add plug tags gin index
+
+Revision ID: e9b4d7f2a6c1
+Revises: d5a9c3e7b2f4
+Create Date: 2025-10-22 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9b4d7f2a6c1'
+down_revision = 'd5a9c3e7b2f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_plugs_tags',
+            'plugs',
+            ['tags'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_plugs_tags',
+            table_name='plugs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,67 @@
+"""add event collection order indexes
+
+Revision ID: f2b7d4e9a1c8
+Revises: e8a3c5d2b6f4
+Create Date: 2025-10-20 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b7d4e9a1c8'
+down_revision = 'e8a3c5d2b6f4'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns) matching each Event collection's order_by
+COMPOSITE_INDEXES = [
+    ('ix_event_agendas_event_day_time', 'event_agendas', ['event_id', 'day', 'start_time']),
+    ('ix_event_expenses_event_created', 'event_expenses', ['event_id', sa.text('created_at DESC')]),
+    ('ix_event_media_zones_event_created', 'event_media_zones', ['event_id', sa.text('created_at DESC')]),
+    ('ix_event_media_event_created', 'event_media', ['event_id', sa.text('created_at DESC')]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in COMPOSITE_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+        
+        # The composites lead with event_id, superseding the single-column FK indexes
+        for _, table, _ in COMPOSITE_INDEXES:
+            op.drop_index(
+                f'ix_{table}_event_id',
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in COMPOSITE_INDEXES:
+            op.create_index(
+                f'ix_{table}_event_id',
+                table,
+                ['event_id'],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
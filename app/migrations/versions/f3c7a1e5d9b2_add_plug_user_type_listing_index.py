@@ -0,0 +1,40 @@
+"""add plug user type listing index
+
+Revision ID: f3c7a1e5d9b2
+Revises: e9b4d7f2a6c1
+Create Date: 2025-10-22 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c7a1e5d9b2'
+down_revision = 'e9b4d7f2a6c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_plugs_user_type_created',
+            'plugs',
+            ['user_id', 'plug_type', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_plugs_user_type_created',
+            table_name='plugs',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
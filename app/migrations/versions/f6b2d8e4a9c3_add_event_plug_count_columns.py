@@ -0,0 +1,91 @@
+"""add event plug count columns
+
+Revision ID: f6b2d8e4a9c3
+Revises: e1a7c9f3b5d2
+Create Date: 2025-10-21 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6b2d8e4a9c3'
+down_revision = 'e1a7c9f3b5d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('target_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('events', sa.Column('contact_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    
+    # Recount one event's non-deleted plugs by type; an event has few plugs, so a
+    # recount is cheap and cannot drift the way +/- deltas can
+    op.execute("""
+        CREATE OR REPLACE FUNCTION refresh_event_plug_counts(p_event_id uuid) RETURNS void AS $$
+            UPDATE events e
+            SET target_count = c.targets,
+                contact_count = c.contacts
+            FROM (
+                SELECT count(*) FILTER (WHERE p.plug_type = 'TARGET') AS targets,
+                       count(*) FILTER (WHERE p.plug_type = 'CONTACT') AS contacts
+                FROM event_plugs ep
+                JOIN plugs p ON p.id = ep.plug_id
+                WHERE ep.event_id = p_event_id
+                  AND NOT ep.is_deleted
+                  AND NOT p.is_deleted
+            ) c
+            WHERE e.id = p_event_id;
+        $$ LANGUAGE sql;
+    """)
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION event_plugs_refresh_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM refresh_event_plug_counts(OLD.event_id);
+            END IF;
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.event_id IS DISTINCT FROM OLD.event_id) THEN
+                PERFORM refresh_event_plug_counts(NEW.event_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_event_plugs_refresh_counts
+        AFTER INSERT OR DELETE OR UPDATE OF event_id, plug_id, is_deleted ON event_plugs
+        FOR EACH ROW EXECUTE FUNCTION event_plugs_refresh_counts();
+    """)
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION plugs_refresh_event_counts() RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_event_plug_counts(ep.event_id)
+            FROM event_plugs ep
+            WHERE ep.plug_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_plugs_refresh_event_counts
+        AFTER UPDATE OF plug_type, is_deleted ON plugs
+        FOR EACH ROW
+        WHEN (OLD.plug_type IS DISTINCT FROM NEW.plug_type OR OLD.is_deleted IS DISTINCT FROM NEW.is_deleted)
+        EXECUTE FUNCTION plugs_refresh_event_counts();
+    """)
+    
+    # Backfill existing events
+    op.execute("SELECT refresh_event_plug_counts(id) FROM events")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_plugs_refresh_event_counts ON plugs")
+    op.execute("DROP FUNCTION IF EXISTS plugs_refresh_event_counts()")
+    op.execute("DROP TRIGGER IF EXISTS trg_event_plugs_refresh_counts ON event_plugs")
+    op.execute("DROP FUNCTION IF EXISTS event_plugs_refresh_counts()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_event_plug_counts(uuid)")
+    op.drop_column('events', 'contact_count')
+    op.drop_column('events', 'target_count')
@@ -0,0 +1,46 @@
+"""add plug and user created_at brin indexes
+
+Revision ID: f8c2a6e9d4b1
+Revises: e4b8d2f6c1a9
+Create Date: 2025-10-22 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8c2a6e9d4b1'
+down_revision = 'e4b8d2f6c1a9'
+branch_labels = None
+depends_on = None
+
+
+BRIN_TABLES = ['plugs', 'users']
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.create_index(
+                f'ix_{table}_created_brin',
+                table,
+                ['created_at'],
+                unique=False,
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32},
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.drop_index(
+                f'ix_{table}_created_brin',
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
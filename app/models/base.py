@@ -1,14 +1,103 @@
 """
 Base SQLAlchemy model with common fields and functionality.
 """
+import json
+import re
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
-from sqlalchemy import Boolean, DateTime, String, func
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from sqlalchemy import Boolean, Column, DateTime, Index, String, event, func, inspect, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.orm import (
+    DeclarativeBase, Mapped, ORMExecuteState, Session, mapped_column, raiseload, selectinload,
+    with_loader_criteria
+)
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.sql import Select
+
+from app.utils.helpers import generate_uuid7
+
+# CamelCase to snake_case patterns for generated table names
+_CAMEL_WORD_RE = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile(r'([a-z0-9])([A-Z])')
+
+# Marker for attributes not present in the instance state dict
+_UNLOADED = object()
+
+# Execution option that opts a statement out of the global soft-delete filter
+INCLUDE_DELETED = "include_deleted"
+
+# JSON-friendly serializers keyed by column Python type; other types pass through
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    uuid.UUID: uuid.UUID.__str__,
+}
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize values the stdlib JSON encoder does not handle, matching orjson's output.
+    
+    Args:
+        value: Value to serialize
+        
+    Returns:
+        JSON-compatible representation
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Fallback encoder used when orjson is not installed
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+
+def _table_column_attrs(cls: type) -> Iterator[Any]:
+    """
+    Iterate the mapped attributes of a class that are backed by table columns.
+    
+    SQL expression attributes (column_property subqueries) are skipped, so
+    serialization never triggers their deferred loads.
+    
+    Args:
+        cls: Mapped model class
+        
+    Returns:
+        Iterator of ColumnProperty objects
+    """
+    return (
+        attr for attr in inspect(cls).column_attrs
+        if isinstance(attr.columns[0], Column)
+    )
+
+
+def _python_type(column_type: Any) -> Optional[type]:
+    """
+    Get the Python type of a column type, if SQLAlchemy defines one.
+    
+    Args:
+        column_type: SQLAlchemy column type
+        
+    Returns:
+        Python type or None when the type does not declare one
+    """
+    try:
+        return column_type.python_type
+    except NotImplementedError:
+        return None
 
 
 class BaseModel(DeclarativeBase):
@@ -22,11 +111,25 @@ class BaseModel(DeclarativeBase):
     - Common utility methods
     """
     
-    # Primary key with UUID
+    # Fetch server-generated values (created_at, updated_at, computed columns) with
+    # RETURNING on the INSERT/UPDATE itself instead of a follow-up SELECT on access
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # Per-class (name, serializer) tuples, built lazily by _serializers()
+    _serializers_cache: Optional[Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]] = None
+    
+    # Per-class mapped column names, built lazily by _updatable_cols()
+    _updatable_cols_cache: Optional[frozenset] = None
+    
+    # Instance __dict__ keys of cached_property values derived from column data;
+    # dropped whenever the instance is refreshed or expired
+    _derived_cache_attrs: Tuple[str, ...] = ()
+    
+    # Primary key with time-ordered UUIDv7 so inserts append to the index instead of splitting random pages
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=generate_uuid7,
         index=True
     )
     
@@ -42,31 +145,66 @@ class BaseModel(DeclarativeBase):
         DateTime(timezone=True),
         server_default=func.now(),
         onupdate=func.now(),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
-    # Soft delete functionality
+    # Soft delete functionality; low-selectivity columns, covered by soft_delete_index()
     is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     deleted_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
     
     @declared_attr
     def __tablename__(cls) -> str:
         """Generate table name from class name."""
         # Convert CamelCase to snake_case
-        import re
-        name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', cls.__name__)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+        return _CAMEL_BOUNDARY_RE.sub(r'\1_\2', _CAMEL_WORD_RE.sub(r'\1_\2', cls.__name__)).lower()
+    
+    @staticmethod
+    def soft_delete_index(table_name: str, *columns: str) -> Index:
+        """
+        Build a partial index over non-deleted rows for use in ``__table_args__``.
+        
+        Args:
+            table_name: Table name used to derive the index name
+            columns: Columns to index, defaults to the primary key
+            
+        Returns:
+            Index named ``ix_<table>_active`` restricted to ``is_deleted = false``
+        """
+        return Index(
+            f"ix_{table_name}_active",
+            *(columns or ("id",)),
+            postgresql_where=text("is_deleted = false")
+        )
+    
+    @classmethod
+    def safe_load_options(cls, *relationships: str) -> Tuple[LoaderOption, ...]:
+        """
+        Build loader options that eagerly load the given relationships and forbid the rest.
+        
+        Any relationship not listed raises on access instead of issuing a lazy
+        SELECT per row, so list endpoints stay at a fixed number of queries.
+        
+        Usage:
+            stmt = select(Event).options(*Event.safe_load_options("agendas"))
+        
+        Args:
+            relationships: Relationship attribute names to load with selectinload
+            
+        Returns:
+            Tuple of loader options for Select.options()
+        """
+        return (
+            *(selectinload(getattr(cls, name)) for name in relationships),
+            raiseload("*"),
+        )
     
     def soft_delete(self) -> None:
         """Mark the record as deleted without removing it from the database."""
@@ -78,6 +216,26 @@ class BaseModel(DeclarativeBase):
         self.is_deleted = False
         self.deleted_at = None
     
+    @classmethod
+    def _serializers(cls) -> Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]:
+        """
+        Get the mapped columns of this class with their value serializers.
+        
+        Serializers are chosen from each column's Python type, so per-row work is a
+        single call instead of an isinstance chain.
+        
+        Returns:
+            Tuple of (attribute name, serializer or None for pass-through), computed once per class
+        """
+        cached = cls.__dict__.get("_serializers_cache")
+        if cached is None:
+            cached = tuple(
+                (attr.key, _SERIALIZERS.get(_python_type(attr.columns[0].type)))
+                for attr in _table_column_attrs(cls)
+            )
+            cls._serializers_cache = cached
+        return cached
+    
     def to_dict(self, exclude: Optional[set] = None) -> Dict[str, Any]:
         """
         Convert model instance to dictionary.
@@ -88,22 +246,151 @@ class BaseModel(DeclarativeBase):
         Returns:
             Dictionary representation of the model
         """
-        exclude = exclude or set()
+        exclude = exclude or ()
+        state_dict = self.__dict__
         result = {}
         
-        for column in self.__table__.columns:
-            if column.name not in exclude:
-                value = getattr(self, column.name)
-                # Handle datetime serialization
-                if isinstance(value, datetime):
-                    value = value.isoformat()
-                # Handle UUID serialization
-                elif isinstance(value, uuid.UUID):
-                    value = str(value)
-                result[column.name] = value
+        for name, serializer in self._serializers():
+            if name in exclude:
+                continue
+            value = state_dict.get(name, _UNLOADED)
+            if value is _UNLOADED:
+                # Expired or deferred attribute; let the ORM load it
+                value = getattr(self, name)
+            if serializer is not None and value is not None:
+                value = serializer(value)
+            result[name] = value
                 
         return result
     
+    def fast_dict(self, exclude: frozenset = frozenset()) -> Dict[str, Any]:
+        """
+        Serialize the already-loaded columns of this instance.
+        
+        Reads the instance state dict without touching attribute descriptors and
+        skips columns that are expired or deferred instead of loading them; use
+        to_dict when every column is required.
+        
+        Args:
+            exclude: Set of field names to exclude from the dictionary
+            
+        Returns:
+            Dictionary of loaded column values
+        """
+        state_dict = inspect(self).dict
+        result = {}
+        
+        for name, serializer in self._serializers():
+            if name in exclude or name not in state_dict:
+                continue
+            value = state_dict[name]
+            if serializer is not None and value is not None:
+                value = serializer(value)
+            result[name] = value
+        
+        return result
+    
+    def _raw_dict(self, exclude: Optional[set] = None) -> Dict[str, Any]:
+        """
+        Get column values as stored on the instance, without serializing them.
+        
+        Args:
+            exclude: Set of field names to exclude from the dictionary
+            
+        Returns:
+            Dictionary of raw column values
+        """
+        exclude = exclude or ()
+        state_dict = self.__dict__
+        result = {}
+        
+        for name, _ in self._serializers():
+            if name in exclude:
+                continue
+            value = state_dict.get(name, _UNLOADED)
+            if value is _UNLOADED:
+                value = getattr(self, name)
+            result[name] = value
+        
+        return result
+    
+    def to_json_bytes(self, exclude: Optional[set] = None) -> bytes:
+        """
+        Serialize model instance straight to JSON bytes.
+        
+        Datetimes and UUIDs are encoded by orjson in C when it is installed,
+        otherwise by the stdlib encoder with the same output format.
+        
+        Args:
+            exclude: Set of field names to exclude from the document
+            
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        raw = self._raw_dict(exclude)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(raw, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_UUID)
+        return _JSON_ENCODER.encode(raw).encode("utf-8")
+    
+    @classmethod
+    def serialize_query(
+        cls,
+        session: Session,
+        stmt: Select,
+        exclude: Optional[set] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Serialize the rows matched by a statement without building ORM instances.
+        
+        The statement's column list is replaced by this model's mapped columns, so
+        ``select(Event).where(...)`` keeps its filters, ordering and limits while
+        rows come back as plain mappings. The output matches ``to_dict()``.
+        
+        Usage:
+            stmt = select(Event).where(Event.user_id == user_id)
+            events = list(Event.serialize_query(db, stmt))
+        
+        Args:
+            session: SQLAlchemy database session
+            stmt: Select statement against this model
+            exclude: Set of field names to exclude from each dictionary
+            
+        Returns:
+            Iterator of dictionaries, one per row
+        """
+        exclude = exclude or ()
+        converters = tuple(
+            (name, convert) for name, convert in cls._serializers()
+            if name not in exclude
+        )
+        stmt = stmt.with_only_columns(*(getattr(cls, name) for name, _ in converters))
+        
+        for row in session.execute(stmt).mappings():
+            item = {}
+            for name, convert in converters:
+                value = row[name]
+                if convert is not None and value is not None:
+                    value = convert(value)
+                item[name] = value
+            yield item
+    
+    @classmethod
+    def _updatable_cols(cls) -> frozenset:
+        """
+        Get the column attribute names update_from_dict may assign.
+        
+        Returns:
+            Frozen set of mapped, non-generated column names, computed once per class
+        """
+        cached = cls.__dict__.get("_updatable_cols_cache")
+        if cached is None:
+            cached = frozenset(
+                attr.key for attr in _table_column_attrs(cls)
+                if attr.columns[0].computed is None
+            )
+            cls._updatable_cols_cache = cached
+        return cached
+    
     def update_from_dict(self, data: Dict[str, Any], exclude: Optional[set] = None) -> None:
         """
         Update model instance from dictionary.
@@ -114,10 +401,57 @@ class BaseModel(DeclarativeBase):
         """
         exclude = exclude or {'id', 'created_at'}  # Never update these fields
         
-        for key, value in data.items():
-            if key not in exclude and hasattr(self, key):
-                setattr(self, key, value)
+        # One C-level set intersection instead of a membership test per payload key
+        for key in data.keys() & self._updatable_cols().difference(exclude):
+            setattr(self, key, data[key])
+    
+    def clear_derived_cache(self) -> None:
+        """Drop cached values computed from column data so they are rebuilt on access."""
+        for name in self._derived_cache_attrs:
+            self.__dict__.pop(name, None)
     
     def __repr__(self) -> str:
         """String representation of the model."""
-        return f"<{self.__class__.__name__}(id={self.id})>"
\ No newline at end of file
+        return f"<{self.__class__.__name__}(id={self.id})>"
+
+
+@event.listens_for(BaseModel, "refresh", propagate=True)
+def _clear_derived_cache_on_refresh(target: BaseModel, context, attrs) -> None:
+    """Drop derived caches when a query, refresh() or populate_existing reloads the row."""
+    target.clear_derived_cache()
+
+
+@event.listens_for(BaseModel, "refresh_flush", propagate=True)
+def _clear_derived_cache_on_refresh_flush(target: BaseModel, flush_context, attrs) -> None:
+    """Drop derived caches when a flush fetches server-generated values."""
+    target.clear_derived_cache()
+
+
+@event.listens_for(BaseModel, "expire", propagate=True)
+def _clear_derived_cache_on_expire(target: BaseModel, attrs) -> None:
+    """Drop derived caches when the instance is expired, e.g. on commit."""
+    target.clear_derived_cache()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """
+    Limit every ORM SELECT, including relationship and eager loads, to non-deleted rows.
+    
+    Statements executed with ``execution_options(include_deleted=True)`` see tombstones.
+    Column loads and refreshes of already-loaded instances are left alone so that a
+    just-deleted object can still be read after commit.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                BaseModel,
+                # "= false" rather than "IS false" so the partial ix_*_active indexes apply
+                lambda cls: cls.is_deleted == False,
+                include_aliases=True
+            )
+        )
@@ -2,17 +2,30 @@
 Event model for managing events and their associated modules.
 """
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import (
-    Boolean, Date, DateTime, ForeignKey, Integer, String, Text, 
-    UniqueConstraint, CheckConstraint, Numeric
+    Boolean, Computed, Date, DateTime, Double, ForeignKey, Index, Integer, String, Text, 
+    UniqueConstraint, CheckConstraint, and_, event as sa_event, func, inspect, literal_column, select,
+    text
 )
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PostgresUUID, JSONB
+from sqlalchemy.orm import Mapped, Session, column_property, mapped_column, relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.base import BaseModel
+from app.utils.datetime import get_request_now
+from app.utils.geo_utils import Coordinates, GeoCalculator
+
+# Session.info key holding budget summaries preloaded by Event.load_budget_summaries
+_BUDGET_CACHE_KEY = "_budget_cache"
+
+# Address fields in display order, fetched together by a single attrgetter call
+_ADDRESS_FIELDS = ("location_name", "location_address", "city", "state", "country", "postal_code")
+_get_address_parts = attrgetter(*_ADDRESS_FIELDS)
 
 
 class Event(BaseModel):
@@ -28,6 +41,9 @@ class Event(BaseModel):
     
     __tablename__ = "events"
     
+    # cached_property values below; set listeners also drop them when their inputs change
+    _derived_cache_attrs = ("_timing", "display_address", "google_maps_url")
+    
     # Basic event information
     title: Mapped[Optional[str]] = mapped_column(
         String(128),
@@ -58,6 +74,16 @@ class Event(BaseModel):
         index=True
     )
     
+    # Number of calendar days (UTC) the event spans, 0 when either date is missing;
+    # stored so list endpoints read it and SQL can filter or sort by it
+    total_days: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            "COALESCE(((end_date AT TIME ZONE 'UTC')::date - (start_date AT TIME ZONE 'UTC')::date) + 1, 0)",
+            persisted=True
+        )
+    )
+    
     # Location information
     location_name: Mapped[Optional[str]] = mapped_column(
         String(128),
@@ -91,15 +117,13 @@ class Event(BaseModel):
     
     # Geographic coordinates (from Google Maps)
     latitude: Mapped[Optional[float]] = mapped_column(
-        Numeric(10, 8),
-        nullable=True,
-        index=True
+        Double,
+        nullable=True
     )
     
     longitude: Mapped[Optional[float]] = mapped_column(
-        Numeric(11, 8),
-        nullable=True,
-        index=True
+        Double,
+        nullable=True
     )
     
     # Additional location metadata (Google Places data)
@@ -132,12 +156,24 @@ class Event(BaseModel):
         nullable=False
     )
     
+    # Denormalized plug counts, maintained by database triggers on event_plugs and plugs
+    target_count: Mapped[int] = mapped_column(
+        Integer,
+        server_default=text("0"),
+        nullable=False
+    )
+    
+    contact_count: Mapped[int] = mapped_column(
+        Integer,
+        server_default=text("0"),
+        nullable=False
+    )
+    
     # User relationship
     user_id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Relationships
@@ -147,103 +183,305 @@ class Event(BaseModel):
     agendas: Mapped[List["EventAgenda"]] = relationship(
         "EventAgenda",
         back_populates="event",
-        cascade="all, delete-orphan",
-        order_by="EventAgenda.day, EventAgenda.start_time"
+        cascade="all, delete-orphan"
     )
     
     expenses: Mapped[List["EventExpense"]] = relationship(
         "EventExpense",
         back_populates="event",
-        cascade="all, delete-orphan",
-        order_by="EventExpense.created_at.desc()"
+        cascade="all, delete-orphan"
     )
     
     media: Mapped[List["EventMedia"]] = relationship(
         "EventMedia",
         back_populates="event",
-        cascade="all, delete-orphan",
-        order_by="EventMedia.created_at.desc()"
+        cascade="all, delete-orphan"
     )
     
     media_zones: Mapped[List["EventMediaZone"]] = relationship(
         "EventMediaZone",
         back_populates="event",
-        cascade="all, delete-orphan",
-        order_by="EventMediaZone.created_at.desc()"
+        cascade="all, delete-orphan"
     )
     
     # Event-Plug associations (many-to-many)
     event_plugs: Mapped[List["EventPlug"]] = relationship(
         "EventPlug",
         back_populates="event",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"  # One batched IN query per page of events instead of one per event
+    )
+    
+    # Read-only views of the collections above without soft-deleted rows; the
+    # is_deleted filter is part of the join (matching the ix_<table>_active
+    # predicates), so deleted rows are never fetched
+    active_expenses: Mapped[List["EventExpense"]] = relationship(
+        "EventExpense",
+        primaryjoin="and_(Event.id == EventExpense.event_id, EventExpense.is_deleted == False)",
+        viewonly=True
+    )
+    
+    active_media: Mapped[List["EventMedia"]] = relationship(
+        "EventMedia",
+        primaryjoin="and_(Event.id == EventMedia.event_id, EventMedia.is_deleted == False)",
+        viewonly=True
+    )
+    
+    active_event_plugs: Mapped[List["EventPlug"]] = relationship(
+        "EventPlug",
+        primaryjoin="and_(Event.id == EventPlug.event_id, EventPlug.is_deleted == False)",
+        viewonly=True
     )
     
     # Constraints
     __table_args__ = (
         CheckConstraint("latitude >= -90 AND latitude <= 90", name="check_latitude_range"),
         CheckConstraint("longitude >= -180 AND longitude <= 180", name="check_longitude_range"),
+        # Spatial index for bounding-box and nearest-event lookups on point(longitude, latitude)
+        Index(
+            "ix_events_location",
+            text("point(longitude, latitude)"),
+            postgresql_using="gist",
+            postgresql_where=text("latitude IS NOT NULL AND longitude IS NOT NULL")
+        ),
+        # Event lists: user's non-deleted events, newest first
+        BaseModel.soft_delete_index("events", "user_id", text("created_at DESC")),
+        # Google Places place_id lookups (see with_place_id); events without one are not indexed
+        Index(
+            "ix_events_place_id",
+            text("(location_metadata ->> 'place_id')"),
+            postgresql_where=text("location_metadata ? 'place_id'")
+        ),
+        # Current/upcoming event lookups by start date; also serves plain user_id lookups
+        Index(
+            "ix_events_user_start",
+            "user_id",
+            text("start_date DESC"),
+            postgresql_include=["title"]
+        ),
         # No unique constraints - allow multiple events with same dates/locations
     )
     
-    @property
-    def total_days(self) -> int:
-        """Calculate total number of event days."""
-        if not self.start_date or not self.end_date:
-            return 0
-        return (self.end_date.date() - self.start_date.date()).days + 1
-    
-    @property
-    def current_day(self) -> int:
-        """Get current day of the event (1-based)."""
+    def timing(self, now: Optional[datetime] = None) -> Tuple[int, bool]:
+        """
+        Compute the current day and whether the event is happening from one reference time.
+        
+        Args:
+            now: Reference time, defaults to the request clock in the event's timezone
+            
+        Returns:
+            Tuple of (current_day, is_happening_now)
+        """
         if not self.start_date or not self.end_date:
-            return 0
+            return 0, False
         
-        now = datetime.now(self.start_date.tzinfo)
+        if now is None:
+            now = get_request_now(self.start_date.tzinfo)
         if now < self.start_date:
-            return 0
+            return 0, False
         elif now > self.end_date:
-            return self.total_days
+            return (self.end_date.date() - self.start_date.date()).days + 1, False
         else:
-            return (now.date() - self.start_date.date()).days + 1
+            return (now.date() - self.start_date.date()).days + 1, True
+    
+    @cached_property
+    def _timing(self) -> Tuple[int, bool]:
+        """Timing computed once per instance so serializers share a single clock read."""
+        return self.timing()
+    
+    @property
+    def current_day(self) -> int:
+        """Get current day of the event (1-based)."""
+        return self._timing[0]
     
     @property
     def is_happening_now(self) -> bool:
         """Check if event is currently happening."""
-        if not self.start_date or not self.end_date:
-            return False
+        return self._timing[1]
+    
+    def _loaded_active_expenses(self) -> Optional[List["EventExpense"]]:
+        """
+        Get the non-deleted expenses if either expense collection is already loaded.
+        
+        Returns:
+            Non-deleted expenses, or None when neither collection is loaded
+        """
+        if "active_expenses" in self.__dict__:
+            return self.active_expenses
+        if "expenses" in self.__dict__ or self.id is None:
+            return [expense for expense in self.expenses if not expense.is_deleted]
+        return None
+    
+    def _aggregate_session(self, collection: str = "expenses") -> Optional[Session]:
+        """
+        Get the session to aggregate a collection in SQL, if that avoids loading it.
         
-        now = datetime.now(self.start_date.tzinfo)
-        return self.start_date <= now <= self.end_date
+        Args:
+            collection: Relationship name the aggregate would otherwise iterate
+            
+        Returns:
+            Owning session when the collection is not loaded yet, otherwise None
+        """
+        if collection in self.__dict__ or self.id is None:
+            return None
+        return inspect(self).session
+    
+    @classmethod
+    def total_budget_for(cls, session: Session, event_id: UUID) -> float:
+        """
+        Calculate an event's total budget with a single SUM query over non-deleted expenses.
+        
+        Args:
+            session: SQLAlchemy database session
+            event_id: Event ID
+            
+        Returns:
+            Sum of expense amounts
+        """
+        return session.scalar(
+            select(func.coalesce(func.sum(EventExpense.amount), 0)).where(
+                EventExpense.event_id == event_id,
+                EventExpense.is_deleted.is_(False)
+            )
+        )
+    
+    @classmethod
+    def expenses_by_category_for(cls, session: Session, event_id: UUID) -> dict:
+        """
+        Get an event's non-deleted expense totals grouped by category with a single query.
+        
+        Args:
+            session: SQLAlchemy database session
+            event_id: Event ID
+            
+        Returns:
+            Dictionary mapping category to summed amount
+        """
+        rows = session.execute(
+            select(EventExpense.category, func.sum(EventExpense.amount))
+            .where(
+                EventExpense.event_id == event_id,
+                EventExpense.is_deleted.is_(False)
+            )
+            .group_by(EventExpense.category)
+        )
+        return dict(rows.tuples())
+    
+    @classmethod
+    def load_budget_summaries(
+        cls,
+        session: Session,
+        event_ids: Iterable[UUID]
+    ) -> Dict[UUID, Tuple[float, dict]]:
+        """
+        Aggregate budgets for many events with one GROUP BY query and cache them on the session.
+        
+        Subsequent total_budget / expenses_by_category reads for these events are
+        served from the cache until the session next flushes.
+        
+        Args:
+            session: SQLAlchemy database session
+            event_ids: IDs of the events to summarize
+            
+        Returns:
+            Dictionary mapping event ID to (total budget, totals by category)
+        """
+        event_ids = list(event_ids)
+        if not event_ids:
+            return {}
+        
+        totals = dict.fromkeys(event_ids, 0)
+        categories = {event_id: {} for event_id in event_ids}
+        rows = session.execute(
+            select(EventExpense.event_id, EventExpense.category, func.sum(EventExpense.amount))
+            .where(
+                EventExpense.event_id.in_(event_ids),
+                EventExpense.is_deleted.is_(False)
+            )
+            .group_by(EventExpense.event_id, EventExpense.category)
+        )
+        for event_id, category, amount in rows.tuples():
+            totals[event_id] += amount
+            categories[event_id][category] = amount
+        
+        summaries = {event_id: (totals[event_id], categories[event_id]) for event_id in event_ids}
+        session.info.setdefault(_BUDGET_CACHE_KEY, {}).update(summaries)
+        return summaries
+    
+    def _cached_budget_summary(self) -> Optional[Tuple[float, dict]]:
+        """
+        Get this event's budget summary preloaded by load_budget_summaries, if any.
+        
+        Returns:
+            Tuple of (total budget, totals by category) or None
+        """
+        session = inspect(self).session
+        if session is None:
+            return None
+        return session.info.get(_BUDGET_CACHE_KEY, {}).get(self.id)
     
     @property
     def total_budget(self) -> float:
-        """Calculate total budget from all expenses."""
-        return sum(expense.amount for expense in self.expenses if not expense.is_deleted)
+        """
+        Calculate total budget from all expenses.
+        
+        Deprecated: prefer total_budget_for(session, event_id). Uses the budget_total
+        column when it was undeferred, then summaries preloaded by
+        load_budget_summaries, then aggregates in SQL when the expenses collection
+        is not already loaded.
+        """
+        if "budget_total" in self.__dict__:
+            return self.__dict__["budget_total"]
+        summary = self._cached_budget_summary()
+        if summary is not None:
+            return summary[0]
+        expenses = self._loaded_active_expenses()
+        if expenses is None:
+            session = self._aggregate_session()
+            if session is not None:
+                return self.total_budget_for(session, self.id)
+            expenses = self.active_expenses
+        return sum(expense.amount for expense in expenses)
     
     @property
     def expenses_by_category(self) -> dict:
-        """Get expenses grouped by category."""
+        """
+        Get expenses grouped by category.
+        
+        Deprecated: prefer expenses_by_category_for(session, event_id). Uses summaries preloaded
+        by load_budget_summaries, then aggregates in SQL when the expenses collection
+        is not already loaded.
+        """
+        summary = self._cached_budget_summary()
+        if summary is not None:
+            return dict(summary[1])
+        expenses = self._loaded_active_expenses()
+        if expenses is None:
+            session = self._aggregate_session()
+            if session is not None:
+                return self.expenses_by_category_for(session, self.id)
+            expenses = self.active_expenses
         categories = {}
-        for expense in self.expenses:
-            if not expense.is_deleted:
-                category = expense.category
-                if category not in categories:
-                    categories[category] = 0
-                categories[category] += expense.amount
+        for expense in expenses:
+            category = expense.category
+            if category not in categories:
+                categories[category] = 0
+            categories[category] += expense.amount
         return categories
     
     @property
     def has_coordinates(self) -> bool:
         """Check if event has valid coordinates."""
-        return self.latitude is not None and self.longitude is not None
+        return self.coordinates is not None
     
     @property
     def coordinates(self) -> Optional[tuple]:
         """Get coordinates as a tuple (latitude, longitude)."""
-        if self.has_coordinates:
-            return (float(self.latitude), float(self.longitude))
-        return None
+        latitude = self.latitude
+        longitude = self.longitude
+        if latitude is None or longitude is None:
+            return None
+        return (latitude, longitude)
     
     def set_coordinates(self, latitude: float, longitude: float, metadata: Optional[dict] = None) -> None:
         """
@@ -264,59 +502,170 @@ class Event(BaseModel):
         if metadata:
             self.location_metadata = metadata
     
+    @classmethod
+    def within_radius(cls, latitude: float, longitude: float, radius_km: float) -> ColumnElement[bool]:
+        """
+        Build a filter for events inside the bounding box of a radius around a point.
+        
+        The condition is written against point(longitude, latitude) so it is served by
+        the ix_events_location GiST index; callers needing an exact circle can refine
+        the (small) result with GeoCalculator.is_within_radius.
+        
+        Usage:
+            stmt = select(Event).where(Event.within_radius(lat, lng, 25))
+        
+        Args:
+            latitude: Center latitude
+            longitude: Center longitude
+            radius_km: Radius in kilometers
+            
+        Returns:
+            SQL boolean expression
+        """
+        min_lat, min_lng, max_lat, max_lng = GeoCalculator.get_bounding_box(
+            Coordinates(latitude=latitude, longitude=longitude), radius_km
+        )
+        return and_(
+            # Repeat the partial index predicate so the planner can use it
+            cls.latitude.isnot(None),
+            cls.longitude.isnot(None),
+            func.point(cls.longitude, cls.latitude).op("<@")(
+                func.box(func.point(min_lng, min_lat), func.point(max_lng, max_lat))
+            )
+        )
+    
+    @classmethod
+    def nearest_to(cls, latitude: float, longitude: float) -> ColumnElement[float]:
+        """
+        Build an ORDER BY expression ranking events by distance to a point.
+        
+        Uses the GiST index's nearest-neighbour (<->) ordering, so
+        ``.order_by(Event.nearest_to(lat, lng)).limit(n)`` reads only n index entries.
+        
+        Args:
+            latitude: Reference latitude
+            longitude: Reference longitude
+            
+        Returns:
+            SQL distance expression in degrees
+        """
+        return func.point(cls.longitude, cls.latitude).op("<->", return_type=Double)(
+            func.point(longitude, latitude)
+        )
+    
+    @classmethod
+    def with_place_id(cls, place_id: str) -> ColumnElement[bool]:
+        """
+        Build a filter for events whose location metadata carries a Google Places place_id.
+        
+        The key is rendered inline rather than as a bound parameter so the expression
+        matches ix_events_place_id exactly.
+        
+        Args:
+            place_id: Google Places place ID
+            
+        Returns:
+            SQL boolean expression
+        """
+        return and_(
+            cls.location_metadata.has_key(literal_column("'place_id'")),
+            cls.location_metadata.op("->>")(literal_column("'place_id'")) == place_id
+        )
+    
     def get_google_maps_url(self) -> Optional[str]:
         """Generate Google Maps URL for the event location."""
-        if not self.has_coordinates:
+        coordinates = self.coordinates
+        if coordinates is None:
             return None
-        return f"https://www.google.com/maps?q={self.latitude},{self.longitude}"
+        return f"https://www.google.com/maps?q={coordinates[0]},{coordinates[1]}"
     
     def get_display_address(self) -> str:
         """Get formatted address for display."""
-        address_parts = []
-        if self.location_name:
-            address_parts.append(self.location_name)
-        if self.location_address:
-            address_parts.append(self.location_address)
-        if self.city:
-            address_parts.append(self.city)
-        if self.state:
-            address_parts.append(self.state)
-        if self.country:
-            address_parts.append(self.country)
-        if self.postal_code:
-            address_parts.append(self.postal_code)
-        
-        return ", ".join(address_parts) if address_parts else "Location not specified"
+        parts = [part for part in _get_address_parts(self) if part]
+        return ", ".join(parts) if parts else "Location not specified"
     
-    @property
+    @cached_property
     def google_maps_url(self) -> Optional[str]:
         """Get Google Maps URL for the event location."""
         return self.get_google_maps_url()
     
-    @property
+    @cached_property
     def display_address(self) -> str:
         """Get formatted address for display."""
         return self.get_display_address()
     
-    @property
-    def plug_counts(self) -> dict:
-        """Get count of plugs by type (targets and contacts)."""
-        from app.models.plug import PlugType
+    @classmethod
+    def plug_counts_for(cls, session: Session, event_id: UUID) -> dict:
+        """
+        Count an event's non-deleted plugs by type with a single GROUP BY query.
         
-        target_count = 0
-        contact_count = 0
+        Args:
+            session: SQLAlchemy database session
+            event_id: Event ID
+            
+        Returns:
+            Dictionary with "targets" and "contacts" counts
+        """
+        from app.models.plug import Plug, PlugType
         
-        for event_plug in self.event_plugs:
-            if not event_plug.is_deleted and event_plug.plug and not event_plug.plug.is_deleted:
-                if event_plug.plug.plug_type == PlugType.TARGET:
-                    target_count += 1
-                elif event_plug.plug.plug_type == PlugType.CONTACT:
-                    contact_count += 1
+        rows = session.execute(
+            select(Plug.plug_type, func.count())
+            .join(EventPlug, EventPlug.plug_id == Plug.id)
+            .where(
+                EventPlug.event_id == event_id,
+                EventPlug.is_deleted.is_(False),
+                Plug.is_deleted.is_(False)
+            )
+            .group_by(Plug.plug_type)
+        )
+        counts = dict(rows.tuples())
         
         return {
-            "targets": target_count,
-            "contacts": contact_count
+            "targets": counts.get(PlugType.TARGET, 0),
+            "contacts": counts.get(PlugType.CONTACT, 0)
         }
+    
+    @property
+    def plug_counts(self) -> dict:
+        """
+        Get count of plugs by type (targets and contacts).
+        
+        Reads the trigger-maintained counter columns; use plug_counts_for for a
+        fresh count inside a transaction that has just changed the event's plugs.
+        """
+        return {
+            "targets": self.target_count or 0,
+            "contacts": self.contact_count or 0
+        }
+
+
+@sa_event.listens_for(Event.start_date, "set")
+@sa_event.listens_for(Event.end_date, "set")
+def _reset_event_timing(target: Event, value, oldvalue, initiator) -> None:
+    """Drop cached timing values when the event dates change."""
+    target.__dict__.pop("_timing", None)
+
+
+def _reset_display_address(target: Event, value, oldvalue, initiator) -> None:
+    """Drop the cached display address when an address field changes."""
+    target.__dict__.pop("display_address", None)
+
+
+for _address_field in _ADDRESS_FIELDS:
+    sa_event.listen(getattr(Event, _address_field), "set", _reset_display_address)
+
+
+@sa_event.listens_for(Event.latitude, "set")
+@sa_event.listens_for(Event.longitude, "set")
+def _reset_google_maps_url(target: Event, value, oldvalue, initiator) -> None:
+    """Drop the cached maps URL when the coordinates change."""
+    target.__dict__.pop("google_maps_url", None)
+
+
+@sa_event.listens_for(Session, "after_flush")
+def _reset_budget_cache(session: Session, flush_context) -> None:
+    """Drop preloaded budget summaries once pending changes reach the database."""
+    session.info.pop(_BUDGET_CACHE_KEY, None)
 
 
 class EventAgenda(BaseModel):
@@ -326,6 +675,8 @@ class EventAgenda(BaseModel):
     
     __tablename__ = "event_agendas"
     
+    _derived_cache_attrs = ("duration_display",)
+    
     # Basic agenda information
     title: Mapped[str] = mapped_column(
         String(256),
@@ -361,12 +712,22 @@ class EventAgenda(BaseModel):
         nullable=False
     )
     
+    # Stored generated column so "agendas ending before X" filters can use an index;
+    # shifting through UTC keeps the expression immutable as Postgres requires
+    end_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        Computed(
+            "((start_time AT TIME ZONE 'UTC') + make_interval(mins => duration_minutes)) AT TIME ZONE 'UTC'",
+            persisted=True
+        ),
+        index=True
+    )
+    
     # Event relationship
     event_id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
         ForeignKey("events.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Relationships
@@ -376,15 +737,11 @@ class EventAgenda(BaseModel):
     __table_args__ = (
         CheckConstraint("day > 0", name="check_positive_day"),
         CheckConstraint("duration_minutes > 0", name="check_positive_duration"),
+        # Matches the (day, start_time) listing order; leading event_id also serves plain FK lookups
+        Index("ix_event_agendas_event_day_time", "event_id", "day", "start_time"),
     )
     
-    @property
-    def end_time(self) -> datetime:
-        """Calculate end time based on start time and duration."""
-        from datetime import timedelta
-        return self.start_time + timedelta(minutes=self.duration_minutes)
-    
-    @property
+    @cached_property
     def duration_display(self) -> str:
         """Get human-readable duration."""
         hours = self.duration_minutes // 60
@@ -398,6 +755,12 @@ class EventAgenda(BaseModel):
             return f"{minutes}m"
 
 
+@sa_event.listens_for(EventAgenda.duration_minutes, "set")
+def _reset_duration_display(target: EventAgenda, value, oldvalue, initiator) -> None:
+    """Drop the cached duration label when the duration changes."""
+    target.__dict__.pop("duration_display", None)
+
+
 class EventExpense(BaseModel):
     """
     Expense tracking for events (Deeds module).
@@ -406,8 +769,10 @@ class EventExpense(BaseModel):
     __tablename__ = "event_expenses"
     
     # Expense details
+    # Free-form, user-entered categories; "C" collation makes equality, GROUP BY
+    # and index comparisons byte-wise instead of locale-aware
     category: Mapped[str] = mapped_column(
-        String(64),
+        String(64, collation="C"),
         nullable=False,
         index=True
     )
@@ -418,8 +783,7 @@ class EventExpense(BaseModel):
     )
     
     amount: Mapped[float] = mapped_column(
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     currency: Mapped[str] = mapped_column(
@@ -432,8 +796,7 @@ class EventExpense(BaseModel):
     event_id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
         ForeignKey("events.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Relationships
@@ -442,9 +805,34 @@ class EventExpense(BaseModel):
     # Constraints
     __table_args__ = (
         CheckConstraint("amount >= 0", name="check_non_negative_amount"),
+        # Matches the newest-first listing order; leading event_id also serves plain FK lookups
+        Index(
+            "ix_event_expenses_event_created",
+            "event_id",
+            text("created_at DESC"),
+            postgresql_include=["amount"]
+        ),
+        # Serves the Event.active_expenses join and aggregates over live expenses
+        BaseModel.soft_delete_index("event_expenses", "event_id"),
+        # Append-only by created_at, so a BRIN index serves time-range scans at a fraction of a btree's size
+        Index("ix_event_expenses_created_brin", "created_at", postgresql_using="brin"),
     )
 
 
+# Opt-in selectable budget: select(Event).options(undefer(Event.budget_total))
+# computes each row's total in the same statement via a correlated subquery
+Event.budget_total = column_property(
+    select(func.coalesce(func.sum(EventExpense.amount), 0))
+    .where(
+        EventExpense.event_id == Event.id,
+        EventExpense.is_deleted.is_(False)
+    )
+    .correlate_except(EventExpense)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
 class EventMediaZone(BaseModel):
     """
     Zone metadata for grouped media uploads.
@@ -466,18 +854,17 @@ class EventMediaZone(BaseModel):
         comment="Zone description applied to all media in this zone"
     )
     
-    tags: Mapped[Optional[str]] = mapped_column(
-        Text,
+    tags: Mapped[Optional[List[str]]] = mapped_column(
+        ARRAY(Text),
         nullable=True,
-        comment="Comma-separated tags applied to all media in this zone"
+        comment="Tags applied to all media in this zone"
     )
     
     # Event relationship
     event_id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
         ForeignKey("events.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Relationships
@@ -489,15 +876,20 @@ class EventMediaZone(BaseModel):
         cascade="all, delete-orphan"
     )
     
+    # Constraints
+    __table_args__ = (
+        Index("ix_event_media_zones_tags", "tags", postgresql_using="gin"),
+        # Matches the newest-first listing order; leading event_id also serves plain FK lookups
+        Index("ix_event_media_zones_event_created", "event_id", text("created_at DESC")),
+    )
+    
     def get_tags_list(self) -> List[str]:
         """Get tags as a list."""
-        if not self.tags:
-            return []
-        return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
+        return self.tags or []
     
     def set_tags_list(self, tags: List[str]) -> None:
         """Set tags from a list."""
-        self.tags = ",".join(tags) if tags else None
+        self.tags = list(tags) if tags else None
 
 
 class EventMedia(BaseModel):
@@ -555,8 +947,7 @@ class EventMedia(BaseModel):
     event_id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
         ForeignKey("events.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Relationships
@@ -566,6 +957,15 @@ class EventMedia(BaseModel):
         back_populates="media_files",
         foreign_keys=[zone_id]
     )
+    
+    # Constraints
+    __table_args__ = (
+        # Matches the newest-first listing order; leading event_id also serves plain FK lookups
+        Index("ix_event_media_event_created", "event_id", text("created_at DESC")),
+        BaseModel.soft_delete_index("event_media", "event_id"),
+        # Append-only by created_at, so a BRIN index serves time-range scans at a fraction of a btree's size
+        Index("ix_event_media_created_brin", "created_at", postgresql_using="brin"),
+    )
 
 
 class EventPlug(BaseModel):
@@ -596,27 +996,29 @@ class EventPlug(BaseModel):
         nullable=True
     )
     
+    # Free-form priority label; byte-wise "C" collation for cheaper filter comparisons
     priority: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        String(32, collation="C"),
         nullable=True,
         index=True
     )
     
     # Relationships
     event: Mapped["Event"] = relationship("Event", back_populates="event_plugs")
-    plug: Mapped["Plug"] = relationship("Plug")
+    # plug_id is NOT NULL, so the plug can always be fetched with an inner join
+    plug: Mapped["Plug"] = relationship("Plug", lazy="joined", innerjoin=True)
     
     # Plug media relationship
     plug_media: Mapped[List["EventPlugMedia"]] = relationship(
         "EventPlugMedia",
         back_populates="event_plug",
-        cascade="all, delete-orphan",
-        order_by="EventPlugMedia.created_at.desc()"
+        cascade="all, delete-orphan"
     )
     
     # Constraints
     __table_args__ = (
         UniqueConstraint("event_id", "plug_id", name="unique_event_plug"),
+        BaseModel.soft_delete_index("event_plugs", "event_id"),
     )
 
 
@@ -685,4 +1087,6 @@ class EventPlugMedia(BaseModel):
             "media_category IN ('snap', 'voice')", 
             name="check_media_category"
         ),
+        # Append-only by created_at, so a BRIN index serves time-range scans at a fraction of a btree's size
+        Index("ix_event_plug_media_created_brin", "created_at", postgresql_using="brin"),
     )
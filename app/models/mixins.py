@@ -3,11 +3,12 @@ Reusable model mixins for common functionality.
 """
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from sqlalchemy import Boolean, DateTime, String, func
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, DateTime, Index, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+from sqlalchemy.sql.elements import ColumnElement
 
 
 class TimestampMixin:
@@ -78,6 +79,11 @@ class AuditMixin:
     Mixin that adds audit trail functionality for tracking changes.
     
     Tracks who created and last modified the record, along with version control.
+    
+    ``version`` is the mapper's version_id_col: every UPDATE is emitted as
+    ``SET version = :new ... WHERE id = :id AND version = :old`` and raises
+    StaleDataError when another writer got there first. List the mixin before
+    BaseModel so its mapper arguments are the ones picked up.
     """
     
     created_by: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -100,14 +106,18 @@ class AuditMixin:
         doc="Version number for optimistic locking"
     )
     
+    @declared_attr.directive
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        """Extend the inherited mapper arguments with optimistic locking on version."""
+        return {**getattr(super(), "__mapper_args__", {}), "version_id_col": cls.__table__.c.version}
+    
     def set_created_by(self, user_id: uuid.UUID) -> None:
         """Set the user who created this record."""
         self.created_by = user_id
     
     def set_updated_by(self, user_id: uuid.UUID) -> None:
-        """Set the user who last updated this record."""
+        """Set the user who last updated this record; version is bumped on flush."""
         self.updated_by = user_id
-        self.version += 1
 
 
 class TenantMixin:
@@ -141,10 +151,10 @@ class MetadataMixin:
     Provides flexible metadata storage and tagging capabilities.
     """
     
-    tags: Mapped[Optional[str]] = mapped_column(
-        String(500),
+    tags: Mapped[Optional[list[str]]] = mapped_column(
+        ARRAY(Text),
         nullable=True,
-        doc="Comma-separated tags for categorization"
+        doc="Tags for categorization"
     )
     
     notes: Mapped[Optional[str]] = mapped_column(
@@ -153,31 +163,55 @@ class MetadataMixin:
         doc="Additional notes or comments"
     )
     
+    @staticmethod
+    def tags_index(table_name: str) -> Index:
+        """
+        Build the GIN index that backs tag containment queries.
+        
+        Args:
+            table_name: Name of the table using the mixin
+            
+        Returns:
+            Index to include in the model's __table_args__
+        """
+        return Index(f"ix_{table_name}_tags", "tags", postgresql_using="gin")
+    
+    @classmethod
+    def tagged_with(cls, *tags: str) -> ColumnElement[bool]:
+        """
+        Filter expression matching records that carry all of the given tags.
+        
+        Args:
+            *tags: Tags the record must have
+            
+        Returns:
+            ``tags @> ARRAY[...]`` expression, served by the GIN index
+        """
+        return cls.tags.contains([tag.strip() for tag in tags])
+    
     def add_tag(self, tag: str) -> None:
         """Add a tag to the record."""
-        if self.tags:
-            existing_tags = set(self.tags.split(','))
-            existing_tags.add(tag.strip())
-            self.tags = ','.join(sorted(existing_tags))
-        else:
-            self.tags = tag.strip()
+        tag = tag.strip()
+        tags = self.tags or []
+        if tag not in tags:
+            # Assign a new list so the change is picked up by the unit of work
+            self.tags = sorted([*tags, tag])
     
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from the record."""
         if self.tags:
-            existing_tags = set(self.tags.split(','))
-            existing_tags.discard(tag.strip())
-            self.tags = ','.join(sorted(existing_tags)) if existing_tags else None
+            tag = tag.strip()
+            remaining = [existing for existing in self.tags if existing != tag]
+            self.tags = remaining or None
     
     def get_tags(self) -> list[str]:
         """Get list of tags."""
-        return [tag.strip() for tag in self.tags.split(',')] if self.tags else []
+        return self.tags or []
     
     def has_tag(self, tag: str) -> bool:
         """Check if the record has a specific tag."""
         return tag.strip() in self.get_tags()
 
-
 # Commonly used mixin combinations
 class BaseEntityMixin(TimestampMixin, SoftDeleteMixin):
     """
@@ -2,11 +2,16 @@
 Plug model for target and contact management.
 """
 from enum import Enum
-from typing import Optional, List
+from typing import Iterable, Optional, List
+from uuid import UUID as PyUUID
 
-from sqlalchemy import String, Text, Boolean, ForeignKey, Enum as SQLEnum, JSON
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    String, Text, Boolean, CheckConstraint, Computed, ForeignKey, Index, SmallInteger, TypeDecorator,
+    Enum as SQLEnum, and_, func, literal, or_, text, update
+)
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 from .base import BaseModel
 
@@ -17,6 +22,41 @@ class PlugType(str, Enum):
     CONTACT = "contact"
 
 
+# SMALLINT codes stored for each plug type; keep in sync with check_plug_type and
+# the refresh_event_plug_counts() SQL function
+PLUG_TYPE_CODES = {PlugType.TARGET: 1, PlugType.CONTACT: 2}
+
+
+# Fields matched by free-text plug search, in the order they are concatenated
+SEARCH_FIELDS = (
+    "coalesce(first_name, '') || ' ' || coalesce(last_name, '')",
+    "coalesce(company, '')",
+    "coalesce(email, '')",
+    "coalesce(job_title, '')",
+    "coalesce(network_type, '')",
+    "coalesce(business_type, '')",
+    "coalesce(connect_reason, '')",
+)
+SEARCH_TEXT_EXPRESSION = " || E'\\n' || ".join(SEARCH_FIELDS)
+
+
+class PlugTypeCode(TypeDecorator):
+    """Store PlugType as a SMALLINT code while exposing the enum in Python."""
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    _plug_types = {code: plug_type for plug_type, code in PLUG_TYPE_CODES.items()}
+    
+    def process_bind_param(self, value, dialect):
+        """Convert a PlugType (or its value) to its stored code."""
+        return None if value is None else PLUG_TYPE_CODES[PlugType(value)]
+    
+    def process_result_value(self, value, dialect):
+        """Convert a stored code back to its PlugType."""
+        return None if value is None else self._plug_types[value]
+
+
 class NetworkType(str, Enum):
     """Network type enumeration - basic options, custom values via metadata."""
     NEW_CLIENT = "new_client"
@@ -49,6 +89,10 @@ class Priority(str, Enum):
     URGENT = "urgent"
 
 
+# Keys that belong in their own columns and must not be duplicated in custom_data
+RESERVED_CUSTOM_DATA_KEYS = frozenset({"network_type", "business_type"})
+
+
 class Plug(BaseModel):
     """
     Plug model representing both targets and contacts in the networking system.
@@ -75,9 +119,10 @@ class Plug(BaseModel):
     
     # Plug type - determines if this is a target or contact
     plug_type: Mapped[PlugType] = mapped_column(
-        SQLEnum(PlugType),
+        # 2-byte integer code (see PLUG_TYPE_CODES); compares and indexes as an integer
+        PlugTypeCode(),
         nullable=False,
-        default=PlugType.TARGET,
+        server_default=text(str(PLUG_TYPE_CODES[PlugType.TARGET])),
         index=True,
         doc="Type of plug: target or contact"
     )
@@ -95,6 +140,12 @@ class Plug(BaseModel):
         doc="Contact's last name"
     )
     
+    full_name: Mapped[str] = mapped_column(
+        String(65),
+        Computed("btrim(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))", persisted=True),
+        doc="Contact's full name, generated by the database"
+    )
+    
     # Optional contact information
     job_title: Mapped[Optional[str]] = mapped_column(
         String(64),
@@ -103,7 +154,7 @@ class Plug(BaseModel):
     )
     
     profile_picture: Mapped[Optional[str]] = mapped_column(
-        String(500),
+        Text,
         nullable=True,
         doc="Profile picture URL"
     )
@@ -147,9 +198,9 @@ class Plug(BaseModel):
     
     # Flexible custom data field for additional information
     custom_data: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
-        doc="Flexible custom data for network/business types and additional fields"
+        doc="Flexible custom data for additional fields; network and business types use their own columns"
     )
     
     # HubSpot integration field
@@ -183,27 +234,77 @@ class Plug(BaseModel):
         doc="Tags associated with the contact"
     )
     
+    # Newline-separated so an ILIKE '%term%' cannot match across two fields
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        Computed(SEARCH_TEXT_EXPRESSION, persisted=True),
+        deferred=True,
+        doc="Searchable fields concatenated by the database, backing the trigram search index"
+    )
+    
     priority: Mapped[Optional[Priority]] = mapped_column(
-        SQLEnum(Priority),
+        SQLEnum(Priority, native_enum=False, create_constraint=True, length=16, name="check_priority"),
         nullable=True,
-        default=Priority.MEDIUM,
+        # Stored as the member name, like every non-native SQLEnum value
+        server_default=Priority.MEDIUM.name,
         doc="Priority level for the contact"
     )
     
     is_contact: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
-        default=False,
+        server_default=text("false"),
         doc="Whether this plug has been converted to a contact"
     )
     
     # Relationships
     user = relationship("User", back_populates="plugs")
     
-    @property
-    def full_name(self) -> str:
-        """Get contact's full name."""
-        return f"{self.first_name} {self.last_name}"
+    # Indexes
+    __table_args__ = (
+        CheckConstraint("plug_type IN (1, 2)", name="check_plug_type"),
+        BaseModel.soft_delete_index("plugs", "user_id"),
+        # "My targets" / "my contacts" listing: equality on user_id and plug_type, newest first
+        Index(
+            "ix_plugs_user_type_created",
+            "user_id",
+            "plug_type",
+            text("created_at DESC"),
+            postgresql_where=text("is_deleted = false")
+        ),
+        # Unfiltered "all my plugs" listing: rows come back pre-sorted so LIMIT stops early
+        Index(
+            "ix_plugs_user_created",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_deleted = false")
+        ),
+        # Recent-activity queries filter and order plugs by updated_at
+        Index("ix_plugs_updated_at", "updated_at"),
+        # jsonb_path_ops supports @> / @? containment and is smaller than the default opclass
+        Index(
+            "ix_plugs_custom_data",
+            "custom_data",
+            postgresql_using="gin",
+            postgresql_ops={"custom_data": "jsonb_path_ops"}
+        ),
+        # Tag filters written as tags @> / && ARRAY[...] use this instead of scanning
+        Index("ix_plugs_tags", "tags", postgresql_using="gin"),
+        # Trigram index for ILIKE '%term%' search over all searchable fields
+        Index(
+            "ix_plugs_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+        # Rows arrive in created_at order, so a BRIN index serves timeline range scans cheaply
+        Index(
+            "ix_plugs_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
     
     @property
     def display_name(self) -> str:
@@ -240,6 +341,69 @@ class Plug(BaseModel):
         self.connect_reason = None
         self.tags = None
     
+    @classmethod
+    def bulk_convert_to_contact(cls, session: Session, ids: Iterable[PyUUID]) -> List[PyUUID]:
+        """
+        Convert many targets to contacts with a single UPDATE.
+        
+        Server-side equivalent of convert_to_contact; instances already loaded in the
+        session are not synchronized and should be expired or re-queried.
+        
+        Args:
+            session: SQLAlchemy database session
+            ids: Plug IDs to convert; non-targets, deleted plugs and plugs that are
+                not complete for contact are skipped
+            
+        Returns:
+            IDs of the plugs actually converted
+        """
+        result = session.execute(
+            update(cls)
+            .where(
+                cls.id.in_(list(ids)),
+                cls.plug_type == PlugType.TARGET,
+                cls.is_deleted == False,
+                cls.complete_for_contact_criteria()
+            )
+            .values(
+                plug_type=PlugType.CONTACT,
+                is_contact=True,
+                priority=func.coalesce(cls.priority, literal(Priority.MEDIUM, cls.priority.type)),
+                network_type=func.coalesce(cls.network_type, NetworkType.NEW_CLIENT.value)
+            )
+            .returning(cls.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars())
+    
+    @classmethod
+    def bulk_revert_to_target(cls, session: Session, ids: Iterable[PyUUID]) -> int:
+        """
+        Revert many contacts to targets with a single UPDATE.
+        
+        Server-side equivalent of revert_to_target; loaded instances are not synchronized.
+        
+        Args:
+            session: SQLAlchemy database session
+            ids: Plug IDs to revert; deleted plugs are skipped
+            
+        Returns:
+            Number of plugs reverted
+        """
+        result = session.execute(
+            update(cls)
+            .where(cls.id.in_(list(ids)), cls.is_deleted == False)
+            .values(
+                plug_type=PlugType.TARGET,
+                is_contact=False,
+                notes=None,
+                connect_reason=None,
+                tags=None
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
     def is_complete_for_contact(self) -> bool:
         """
         Check if plug has minimum required information to be converted to contact.
@@ -248,6 +412,38 @@ class Plug(BaseModel):
         has_contact_info = bool(self.email or self.primary_number)
         return bool(self.first_name and self.last_name and has_contact_info)
     
+    @classmethod
+    def search_matches(cls, search_term: str) -> ColumnElement[bool]:
+        """
+        Filter expression for free-text search across name, company, email and type fields.
+        
+        Args:
+            search_term: Substring to match, case-insensitively
+            
+        Returns:
+            ``search_text ILIKE '%term%'`` expression, served by the trigram index
+        """
+        return cls.search_text.ilike(f"%{search_term}%")
+    
+    @classmethod
+    def complete_for_contact_criteria(cls) -> ColumnElement[bool]:
+        """
+        SQL counterpart of is_complete_for_contact, for filtering rows server-side.
+        
+        Empty strings count as missing, matching the truthiness test in Python.
+        
+        Returns:
+            SQL boolean expression
+        """
+        def present(column):
+            return func.coalesce(column, "") != ""
+        
+        return and_(
+            present(cls.first_name),
+            present(cls.last_name),
+            or_(present(cls.email), present(cls.primary_number))
+        )
+    
     def __repr__(self) -> str:
         """String representation of Plug."""
         return f"<Plug(id={self.id}, name={self.full_name}, type={self.plug_type})>"
@@ -1,10 +1,11 @@
 """
 User model for authentication and user management.
 """
-from sqlalchemy import String, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Boolean, Computed, Index, func, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from typing import List, TYPE_CHECKING
 
+from app.utils.datetime import get_current_utc_time
 from .base import BaseModel
 
 if TYPE_CHECKING:
@@ -45,6 +46,12 @@ class User(BaseModel):
         doc="User last name"
     )
     
+    full_name: Mapped[str] = mapped_column(
+        String(65),
+        Computed("first_name || ' ' || last_name", persisted=True),
+        doc="User full name, generated by the database"
+    )
+    
     # Optional profile fields
     profile_picture: Mapped[str] = mapped_column(
         String(500),
@@ -68,14 +75,14 @@ class User(BaseModel):
     timezone: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        default="UTC",
+        server_default="UTC",
         doc="User timezone"
     )
     
     # Status fields
     is_active: Mapped[bool] = mapped_column(
         Boolean,
-        default=True,
+        server_default=text("true"),
         nullable=False,
         doc="User active status"
     )
@@ -95,10 +102,22 @@ class User(BaseModel):
         doc="User's events"
     )
     
-    @property
-    def full_name(self) -> str:
-        """Get user's full name."""
-        return f"{self.first_name} {self.last_name}"
+    # Case-insensitive login lookups: func.lower(User.email) == normalized address
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        # Sign-ups arrive in created_at order, so a BRIN index serves date-range scans cheaply
+        Index(
+            "ix_users_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
+    
+    @validates("email")
+    def _normalize_email(self, key: str, value: str) -> str:
+        """Store email addresses trimmed and lowercased."""
+        return value.strip().lower() if value else value
     
     @property
     def display_name(self) -> str:
@@ -112,17 +131,12 @@ class User(BaseModel):
     def deactivate(self) -> None:
         """Deactivate user account."""
         self.is_active = False
-        self.updated_at = self._get_current_utc_time()
+        self.updated_at = get_current_utc_time()
     
     def activate(self) -> None:
         """Activate user account."""
         self.is_active = True
-        self.updated_at = self._get_current_utc_time()
-    
-    def _get_current_utc_time(self):
-        """Get current UTC time using common utility."""
-        from app.utils.datetime import get_current_utc_time
-        return get_current_utc_time()
+        self.updated_at = get_current_utc_time()
     
     def __repr__(self) -> str:
         """String representation of User."""
@@ -3,12 +3,13 @@ Base repository implementation with SQLAlchemy providing generic CRUD operations
 """
 import logging
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar, Union
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_, text
+from sqlalchemy import and_, cast, column, desc, func, insert, inspect, or_, text, update, values
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.exceptions import DatabaseError, NotFoundError, TransactionError, ValidationError
 from app.models.base import BaseModel
@@ -70,7 +71,7 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             # Refresh to get all computed fields
             await self.refresh(db_obj)
             
-            logger.debug(f"Created {self.model.__name__} with ID: {db_obj.id}")
+            logger.debug("Created %s with ID: %s", self.model.__name__, db_obj.id)
             return db_obj
             
         except IntegrityError as e:
@@ -110,9 +111,9 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             result = query.first()
             
             if result:
-                logger.debug(f"Found {self.model.__name__} with ID: {id}")
+                logger.debug("Found %s with ID: %s", self.model.__name__, id)
             else:
-                logger.debug(f"{self.model.__name__} not found with ID: {id}")
+                logger.debug("%s not found with ID: %s", self.model.__name__, id)
                 
             return result
             
@@ -130,7 +131,8 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        options: Sequence[LoaderOption] = ()
     ) -> List[ModelType]:
         """
         Get multiple records with filtering, pagination, and sorting.
@@ -139,18 +141,19 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
             filters: Dictionary of field filters
-            order_by: Field name to order by (prefix with '-' for descending)
+            order_by: Comma-separated field names to order by (prefix with '-' for descending)
             include_deleted: Whether to include soft-deleted records
+            options: Loader options for the query, e.g. Model.safe_load_options()
             
         Returns:
             List of model instances
         """
         try:
-            query = self.db.query(self.model)
+            query = self.db.query(self.model).options(*options)
             
-            # Apply soft delete filter
-            if not include_deleted:
-                query = query.filter(self.model.is_deleted == False)
+            # Soft-deleted rows are filtered globally; opt out when asked to include them
+            if include_deleted:
+                query = query.execution_options(include_deleted=True)
             
             # Apply custom filters
             if filters:
@@ -215,7 +218,7 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             await self.flush()
             await self.refresh(db_obj)
             
-            logger.debug(f"Updated {self.model.__name__} with ID: {id}")
+            logger.debug("Updated %s with ID: %s", self.model.__name__, id)
             return db_obj
             
         except IntegrityError as e:
@@ -259,12 +262,12 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
                 # Soft delete
                 db_obj.soft_delete()
                 await self.flush()
-                logger.debug(f"Soft deleted {self.model.__name__} with ID: {id}")
+                logger.debug("Soft deleted %s with ID: %s", self.model.__name__, id)
             else:
                 # Hard delete
                 self.db.delete(db_obj)
                 await self.flush()
-                logger.debug(f"Hard deleted {self.model.__name__} with ID: {id}")
+                logger.debug("Hard deleted %s with ID: %s", self.model.__name__, id)
             
             return True
             
@@ -294,7 +297,7 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
                     self.model.id == id,
                     self.model.is_deleted == True
                 )
-            )
+            ).execution_options(include_deleted=True)
             db_obj = query.first()
             
             if not db_obj:
@@ -305,7 +308,7 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             await self.flush()
             await self.refresh(db_obj)
             
-            logger.debug(f"Restored {self.model.__name__} with ID: {id}")
+            logger.debug("Restored %s with ID: %s", self.model.__name__, id)
             return db_obj
             
         except Exception as e:
@@ -364,9 +367,9 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
         try:
             query = self.db.query(func.count(self.model.id))
             
-            # Apply soft delete filter
-            if not include_deleted:
-                query = query.filter(self.model.is_deleted == False)
+            # Soft-deleted rows are filtered globally; opt out when asked to include them
+            if include_deleted:
+                query = query.execution_options(include_deleted=True)
             
             # Apply custom filters
             if filters:
@@ -374,7 +377,7 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             
             result = query.scalar()
             
-            logger.debug(f"Counted {result} {self.model.__name__} records")
+            logger.debug("Counted %s %s records", result, self.model.__name__)
             return result or 0
             
         except Exception as e:
@@ -405,9 +408,9 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
         try:
             query = self.db.query(self.model)
             
-            # Apply soft delete filter
-            if not include_deleted:
-                query = query.filter(self.model.is_deleted == False)
+            # Soft-deleted rows are filtered globally; opt out when asked to include them
+            if include_deleted:
+                query = query.execution_options(include_deleted=True)
             
             # Apply custom filters
             query = self._apply_filters(query, filters)
@@ -418,7 +421,7 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             
             results = query.all()
             
-            logger.debug(f"Found {len(results)} {self.model.__name__} records by filters")
+            logger.debug("Found %s %s records by filters", len(results), self.model.__name__)
             return results
             
         except Exception as e:
@@ -475,18 +478,14 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             return []
         
         try:
-            # Create instances
-            db_objects = [self.model(**obj_data) for obj_data in objects_in]
-            
-            # Add all to session
-            self.db.add_all(db_objects)
-            await self.flush()
-            
-            # Refresh all instances
-            for db_obj in db_objects:
-                await self.refresh(db_obj)
-            
-            logger.debug(f"Bulk created {len(db_objects)} {self.model.__name__} records")
+            # ORM bulk INSERT: batched into multi-row VALUES pages (insertmanyvalues) with
+            # RETURNING, so server defaults come back without a per-row refresh
+            db_objects = list(self.db.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                [self._run_validators(obj_in) for obj_in in objects_in]
+            ))
+            
+            logger.debug("Bulk created %s %s records", len(db_objects), self.model.__name__)
             return db_objects
             
         except IntegrityError as e:
@@ -529,8 +528,9 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             return []
         
         try:
-            updated_objects = []
-            
+            # Merge repeated IDs so the last value wins, as it did when rows were updated one by one
+            merged: Dict[UUID, Dict[str, Any]] = {}
+            updatable = self.model._updatable_cols() - {"id", "created_at"}
             for update_data in updates:
                 if id_field not in update_data:
                     raise ValidationError(
@@ -538,23 +538,65 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
                         error_code="MISSING_ID_FIELD"
                     )
                 
-                record_id = update_data.pop(id_field)
-                db_obj = await self.get(record_id)
-                
-                if db_obj:
-                    db_obj.update_from_dict(update_data)
-                    updated_objects.append(db_obj)
+                record_id = update_data[id_field]
+                if not isinstance(record_id, UUID):
+                    try:
+                        record_id = UUID(str(record_id))
+                    except ValueError:
+                        raise ValidationError(
+                            f"Invalid {id_field} in update data: {record_id!r}",
+                            error_code="INVALID_ID_FIELD"
+                        )
+                fields = merged.setdefault(record_id, {})
+                for key in update_data.keys() & updatable:
+                    fields[key] = update_data[key]
+            
+            # One UPDATE ... FROM (VALUES ...) per distinct set of updated columns, with
+            # values normalized by the model's validators as update_from_dict would
+            groups: Dict[tuple, List[UUID]] = {}
+            for record_id, fields in merged.items():
+                if fields:
+                    merged[record_id] = self._run_validators(fields)
+                    groups.setdefault(tuple(sorted(fields)), []).append(record_id)
+            
+            columns = inspect(self.model).columns
+            for keys, record_ids in groups.items():
+                source = values(
+                    column("id", columns["id"].type),
+                    *(column(key, columns[key].type) for key in keys),
+                    name="updates"
+                ).data([
+                    (record_id, *(merged[record_id][key] for key in keys))
+                    for record_id in record_ids
+                ])
+                # VALUES columns are untyped on the server, so cast back to each column's type
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == source.c.id, self.model.is_deleted == False)
+                    .values({key: cast(source.c[key], columns[key].type) for key in keys})
+                    .execution_options(synchronize_session=False)
+                )
+                self.db.execute(stmt)
             
-            # Flush all changes
-            await self.flush()
+            # Reload the touched rows once, overwriting any stale copies held by the session
+            loaded = self.db.query(self.model).filter(
+                and_(
+                    self.model.id.in_(list(merged)),
+                    self.model.is_deleted == False
+                )
+            ).populate_existing().all()
+            by_id = {db_obj.id: db_obj for db_obj in loaded}
+            updated_objects = [by_id[record_id] for record_id in merged if record_id in by_id]
             
-            # Refresh all instances
+            # The UPDATE fired no attribute set events, so drop values cached from the old row
             for db_obj in updated_objects:
-                await self.refresh(db_obj)
+                db_obj.clear_derived_cache()
             
-            logger.debug(f"Bulk updated {len(updated_objects)} {self.model.__name__} records")
+            logger.debug("Bulk updated %s %s records", len(updated_objects), self.model.__name__)
             return updated_objects
             
+        except ValidationError:
+            raise
         except IntegrityError as e:
             await self.rollback_transaction()
             logger.error(f"Integrity error bulk updating {self.model.__name__}: {e}")
@@ -594,21 +636,20 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             return 0
         
         try:
-            deleted_count = 0
-            
             if soft:
-                # Soft delete - update records
-                query = self.db.query(self.model).filter(
-                    and_(
-                        self.model.id.in_(ids),
-                        self.model.is_deleted == False
+                # Soft delete - one UPDATE; "fetch" uses RETURNING to sync loaded instances
+                stmt = (
+                    update(self.model)
+                    .where(
+                        and_(
+                            self.model.id.in_(ids),
+                            self.model.is_deleted == False
+                        )
                     )
+                    .values(is_deleted=True, deleted_at=func.now())
+                    .execution_options(synchronize_session="fetch")
                 )
-                
-                records = query.all()
-                for record in records:
-                    record.soft_delete()
-                    deleted_count += 1
+                deleted_count = self.db.execute(stmt).rowcount
                     
             else:
                 # Hard delete
@@ -617,7 +658,7 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             
             await self.flush()
             
-            logger.debug(f"Bulk deleted {deleted_count} {self.model.__name__} records")
+            logger.debug("Bulk deleted %s %s records", deleted_count, self.model.__name__)
             return deleted_count
             
         except Exception as e:
@@ -745,6 +786,32 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
             )
 
     # Private Helper Methods
+    def _run_validators(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply the model's @validates hooks to raw column values.
+        
+        Bulk INSERT/UPDATE statements skip attribute events, so values that
+        create() or update_from_dict() would normalize are normalized here.
+        
+        Args:
+            data: Column values keyed by attribute name
+            
+        Returns:
+            The same values, validated; ``data`` itself when the model has no validators for them
+        """
+        validators = inspect(self.model).validators
+        keys = data.keys() & validators.keys()
+        if not keys:
+            return data
+        
+        # Validators are instance methods; a transient instance stands in for the row
+        probe = self.model()
+        validated = dict(data)
+        for key in keys:
+            method, _ = validators[key]
+            validated[key] = method(probe, key, validated[key])
+        return validated
+    
     def _apply_filters(self, query, filters: Dict[str, Any]):
         """
         Apply filters to a SQLAlchemy query.
@@ -801,29 +868,32 @@ class BaseRepository(IBaseRepository[ModelType], Generic[ModelType]):
         
         Args:
             query: SQLAlchemy query object
-            order_by: Field name to order by (prefix with '-' for descending)
+            order_by: Comma-separated field names to order by (prefix with '-' for descending)
             
         Returns:
             Modified query with ordering applied
         """
-        # Handle descending order (prefix with '-')
-        if order_by.startswith('-'):
-            field_name = order_by[1:]
-            descending = True
-        else:
-            field_name = order_by
-            descending = False
-        
-        # Check if field exists on model
-        if not hasattr(self.model, field_name):
-            logger.warning(f"Invalid order field: {field_name}")
-            return query
-        
-        column = getattr(self.model, field_name)
-        
-        if descending:
-            query = query.order_by(desc(column))
-        else:
-            query = query.order_by(column)
+        for field in order_by.split(','):
+            field = field.strip()
+            
+            # Handle descending order (prefix with '-')
+            if field.startswith('-'):
+                field_name = field[1:]
+                descending = True
+            else:
+                field_name = field
+                descending = False
+            
+            # Check if field exists on model
+            if not hasattr(self.model, field_name):
+                logger.warning(f"Invalid order field: {field_name}")
+                continue
+            
+            column = getattr(self.model, field_name)
+            
+            if descending:
+                query = query.order_by(desc(column))
+            else:
+                query = query.order_by(column)
         
         return query
\ No newline at end of file
@@ -52,7 +52,7 @@ class EventPlugMediaRepository(BaseRepository[EventPlugMedia]):
             
             media = query.order_by(desc(EventPlugMedia.created_at)).all()
             
-            logger.debug(f"Retrieved {len(media)} media items for plug {plug_id} in event {event_id}")
+            logger.debug("Retrieved %s media items for plug %s in event %s", len(media), plug_id, event_id)
             return media
             
         except Exception as e:
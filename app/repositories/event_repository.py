@@ -2,7 +2,7 @@
 Repository for event operations.
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
@@ -10,7 +10,7 @@ from sqlalchemy import and_, desc, func, or_
 from sqlalchemy.orm import Session, joinedload
 
 from app.core.exceptions import DatabaseError, ValidationError
-from app.models.event import Event, EventAgenda, EventExpense, EventMedia, EventPlug
+from app.models.event import Event, EventAgenda, EventExpense, EventMedia, EventMediaZone, EventPlug
 from app.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -97,6 +97,9 @@ class EventRepository(BaseRepository[Event]):
             # Get total count
             total_count = await self.count(filters=base_filters)
             
+            # Aggregate budgets for the whole page in one query
+            Event.load_budget_summaries(self.db, [event.id for event in events])
+            
             return events, total_count
             
         except Exception as e:
@@ -148,7 +151,10 @@ class EventRepository(BaseRepository[Event]):
             # Get paginated results
             results = query.order_by(desc(self.model.created_at)).offset(skip).limit(limit).all()
             
-            logger.debug(f"Found {len(results)} events matching search term '{search_term}' for user {user_id}")
+            # Aggregate budgets for the whole page in one query
+            Event.load_budget_summaries(self.db, [event.id for event in results])
+            
+            logger.debug("Found %s events matching search term '%s' for user %s", len(results), search_term, user_id)
             return results, total_count
             
         except Exception as e:
@@ -183,7 +189,7 @@ class EventRepository(BaseRepository[Event]):
             active_events = base_query.filter(self.model.is_active == True).count()
             
             # Upcoming events (start date in future)
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc)
             upcoming_events = base_query.filter(self.model.start_date > now).count()
             past_events = base_query.filter(self.model.end_date < now).count()
             
@@ -249,7 +255,7 @@ class EventRepository(BaseRepository[Event]):
                 "events_by_country": events_by_country
             }
             
-            logger.debug(f"Generated event stats for user {user_id}: {stats}")
+            logger.debug("Generated event stats for user %s: %s", user_id, stats)
             return stats
             
         except Exception as e:
@@ -476,26 +482,25 @@ class EventMediaRepository(BaseRepository[EventMedia]):
             Tuple of (matching media list, total count)
         """
         try:
-            # Build search query
-            query = self.db.query(self.model).filter(
+            # Build search query; tags live on the zone and match any of the provided tags
+            # through the GIN-indexed array overlap operator
+            query = self.db.query(self.model).join(
+                EventMediaZone, self.model.zone_id == EventMediaZone.id
+            ).filter(
                 and_(
                     self.model.event_id == event_id,
                     self.model.is_deleted == False,
-                    self.model.tags.isnot(None)
+                    EventMediaZone.tags.overlap(tags)
                 )
             )
             
-            # Search for any of the provided tags
-            tag_conditions = [self.model.tags.ilike(f"%{tag}%") for tag in tags]
-            query = query.filter(or_(*tag_conditions))
-            
             # Get total count
             total_count = query.count()
             
             # Get paginated results
             results = query.order_by(desc(self.model.created_at)).offset(skip).limit(limit).all()
             
-            logger.debug(f"Found {len(results)} media items matching tags {tags} for event {event_id}")
+            logger.debug("Found %s media items matching tags %s for event %s", len(results), tags, event_id)
             return results, total_count
             
         except Exception as e:
@@ -532,7 +537,7 @@ class EventMediaRepository(BaseRepository[EventMedia]):
             
             results = query.order_by(desc(self.model.created_at)).all()
             
-            logger.debug(f"Found {len(results)} media items for batch {batch_id} in event {event_id}")
+            logger.debug("Found %s media items for batch %s in event %s", len(results), batch_id, event_id)
             return results
             
         except Exception as e:
@@ -569,7 +574,7 @@ class EventMediaRepository(BaseRepository[EventMedia]):
             
             results = query.order_by(desc(self.model.created_at)).all()
             
-            logger.debug(f"Found {len(results)} media items for zone {zone_id} in event {event_id}")
+            logger.debug("Found %s media items for zone %s in event %s", len(results), zone_id, event_id)
             return results
             
         except Exception as e:
@@ -689,16 +694,7 @@ class EventPlugRepository(BaseRepository[EventPlug]):
             
             # Search query across plug fields
             if search_query:
-                search_term = f"%{search_query}%"
-                query = query.join(self.model.plug).filter(
-                    or_(
-                        Plug.first_name.ilike(search_term),
-                        Plug.last_name.ilike(search_term),
-                        Plug.company.ilike(search_term),
-                        Plug.email.ilike(search_term),
-                        Plug.network_type.ilike(search_term)
-                    )
-                )
+                query = query.join(self.model.plug).filter(Plug.search_matches(search_query))
             
             # Get total count
             total_count = query.count()
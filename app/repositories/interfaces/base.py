@@ -6,6 +6,7 @@ from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar, Union
 from uuid import UUID
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.models.base import BaseModel
 
@@ -70,7 +71,8 @@ class IBaseRepository(ABC, Generic[ModelType]):
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None,
         order_by: Optional[str] = None,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        options: Sequence[LoaderOption] = ()
     ) -> List[ModelType]:
         """
         Get multiple records with filtering, pagination, and sorting.
@@ -79,8 +81,9 @@ class IBaseRepository(ABC, Generic[ModelType]):
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
             filters: Dictionary of field filters
-            order_by: Field name to order by (prefix with '-' for descending)
+            order_by: Comma-separated field names to order by (prefix with '-' for descending)
             include_deleted: Whether to include soft-deleted records
+            options: Loader options for the query, e.g. Model.safe_load_options()
             
         Returns:
             List of model instances
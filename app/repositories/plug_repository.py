@@ -1,20 +1,54 @@
 """
 Repository for plug (target/contact) operations.
 """
+import csv
+import io
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, desc, func
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import DatabaseError, ValidationError
-from app.models.plug import Plug, PlugType, NetworkType, Priority
+from app.models.plug import PLUG_TYPE_CODES, Plug, PlugType, NetworkType, Priority
 from app.repositories.base import BaseRepository
+from app.utils.helpers import generate_uuid7
 
 logger = logging.getLogger(__name__)
 
+# Columns written by copy_import; everything else comes from server defaults or is generated
+_COPY_COLUMNS = (
+    "id", "user_id", "plug_type", "first_name", "last_name", "job_title", "profile_picture",
+    "company", "email", "primary_number", "secondary_number", "linkedin_url", "notes",
+    "custom_data", "hubspot_pipeline_stage", "network_type", "business_type",
+    "connect_reason", "tags", "priority", "is_contact", "is_deleted"
+)
+
+# Keys an import row may carry; user_id and is_deleted are set by the importer
+_IMPORT_FIELDS = frozenset(_COPY_COLUMNS) - {"user_id", "is_deleted"}
+
+
+def _copy_value(value: Any) -> Any:
+    """Convert a column value for COPY CSV input; NULL is written as an empty unquoted field."""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        # str-based enums would otherwise be written as "NetworkType.NEW_CLIENT"
+        return value.value
+    return value
+
+
+def _pg_array_literal(values: Optional[List[str]]) -> Optional[str]:
+    """Render a list of strings as a PostgreSQL array literal for COPY text input."""
+    if values is None:
+        return None
+    quoted = ('"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"' for value in values)
+    return "{" + ",".join(quoted) + "}"
+
 
 class PlugRepository(BaseRepository[Plug]):
     """
@@ -65,6 +99,105 @@ class PlugRepository(BaseRepository[Plug]):
                 details={"user_id": str(user_id), "error": str(e)}
             )
 
+    async def copy_import(self, user_id: UUID, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Import many plugs for a user through PostgreSQL COPY.
+        
+        Rows are serialized to CSV and sent with COPY ... FROM STDIN on the session's
+        own connection, so they commit or roll back with the surrounding transaction.
+        Other dialects fall back to bulk_create.
+        
+        Args:
+            user_id: Owner user ID
+            rows: Plug data dictionaries keyed by column name
+            
+        Returns:
+            Number of plugs imported
+            
+        Raises:
+            ValidationError: If a row has unknown keys or invalid values; nothing is imported
+            DatabaseError: If the import fails
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            rows = list(rows)
+            for index, row in enumerate(rows):
+                self._check_import_row(user_id, index, row)
+            return len(await self.bulk_create([{**row, "user_id": user_id} for row in rows]))
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        count = 0
+        for index, row in enumerate(rows):
+            self._check_import_row(user_id, index, row)
+            try:
+                plug_type = PlugType(row.get("plug_type") or PlugType.TARGET)
+                priority = row.get("priority", Priority.MEDIUM)
+                custom_data = row.get("custom_data")
+                record = {
+                    **row,
+                    "id": row.get("id") or generate_uuid7(),
+                    "user_id": user_id,
+                    "plug_type": PLUG_TYPE_CODES[plug_type],
+                    # Priority stores the member name
+                    "priority": Priority(priority).name if priority is not None else None,
+                    "custom_data": json.dumps(custom_data) if custom_data is not None else None,
+                    "tags": _pg_array_literal(row.get("tags")),
+                    "is_contact": row.get("is_contact", plug_type == PlugType.CONTACT),
+                    "is_deleted": False
+                }
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                raise ValidationError(
+                    f"Invalid plug import row {index}: {e}",
+                    error_code="INVALID_PLUG_IMPORT_ROW",
+                    details={"user_id": str(user_id), "row": index, "error": str(e)}
+                )
+            writer.writerow([_copy_value(record.get(column)) for column in _COPY_COLUMNS])
+            count += 1
+        
+        if not count:
+            return 0
+        
+        try:
+            buffer.seek(0)
+            dbapi_connection = self.db.connection().connection
+            with dbapi_connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY plugs ({', '.join(_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                    buffer
+                )
+            
+            logger.debug("Copied %s plugs for user %s", count, user_id)
+            return count
+            
+        except Exception as e:
+            await self.rollback_transaction()
+            logger.error(f"Error copying plugs for user {user_id}: {e}")
+            raise DatabaseError(
+                "Failed to import plugs",
+                error_code="PLUG_IMPORT_ERROR",
+                details={"user_id": str(user_id), "count": count, "error": str(e)}
+            )
+
+    def _check_import_row(self, user_id: UUID, index: int, row: Dict[str, Any]) -> None:
+        """
+        Reject import rows carrying keys that would otherwise be silently dropped.
+        
+        Args:
+            user_id: Owner user ID, for error details
+            index: Position of the row in the import
+            row: Plug data dictionary
+            
+        Raises:
+            ValidationError: If the row has keys outside the importable columns
+        """
+        unknown = sorted(row.keys() - _IMPORT_FIELDS)
+        if unknown:
+            raise ValidationError(
+                f"Invalid plug import row {index}: unknown fields {', '.join(unknown)}",
+                error_code="INVALID_PLUG_IMPORT_ROW",
+                details={"user_id": str(user_id), "row": index, "unknown_fields": unknown}
+            )
+
     # Conversion Methods
     async def convert_target_to_contact(
         self,
@@ -164,7 +297,8 @@ class PlugRepository(BaseRepository[Plug]):
                 skip=skip,
                 limit=limit,
                 filters=base_filters,
-                order_by="-created_at"
+                order_by="-created_at",
+                options=Plug.safe_load_options()
             )
             
             # Get total count
@@ -204,19 +338,11 @@ class PlugRepository(BaseRepository[Plug]):
         """
         try:
             # Build search query with expanded search criteria
-            query = self.db.query(self.model).filter(
+            query = self.db.query(self.model).options(*Plug.safe_load_options()).filter(
                 and_(
                     self.model.user_id == user_id,
                     self.model.is_deleted == False,
-                    or_(
-                        func.concat(self.model.first_name, ' ', self.model.last_name).ilike(f"%{search_term}%"),
-                        self.model.company.ilike(f"%{search_term}%"),
-                        self.model.email.ilike(f"%{search_term}%"),
-                        self.model.job_title.ilike(f"%{search_term}%"),
-                        self.model.network_type.ilike(f"%{search_term}%"),
-                        self.model.business_type.ilike(f"%{search_term}%"),
-                        self.model.connect_reason.ilike(f"%{search_term}%")
-                    )
+                    self.model.search_matches(search_term)
                 )
             )
             
@@ -229,7 +355,7 @@ class PlugRepository(BaseRepository[Plug]):
             # Get paginated results
             results = query.order_by(desc(self.model.created_at)).offset(skip).limit(limit).all()
             
-            logger.debug(f"Found {len(results)} plugs matching search term '{search_term}' for user {user_id}")
+            logger.debug("Found %s plugs matching search term '%s' for user %s", len(results), search_term, user_id)
             return results, total_count
             
         except Exception as e:
@@ -276,13 +402,14 @@ class PlugRepository(BaseRepository[Plug]):
                 skip=skip,
                 limit=limit,
                 filters=base_filters,
-                order_by="-created_at"
+                order_by="-created_at",
+                options=Plug.safe_load_options()
             )
             
             # Get total count
             total_count = await self.count(filters=base_filters)
             
-            logger.debug(f"Found {len(plugs)} plugs with network_type '{network_type}' for user {user_id}")
+            logger.debug("Found %s plugs with network_type '%s' for user %s", len(plugs), network_type, user_id)
             return plugs, total_count
             
         except Exception as e:
@@ -333,7 +460,7 @@ class PlugRepository(BaseRepository[Plug]):
             contacts_by_network_type = {str(nt): count for nt, count in network_type_stats if nt}
             
             # Recent conversions (last 30 days)
-            thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+            thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
             recent_conversions = self.db.query(func.count(self.model.id)).filter(
                 and_(
                     self.model.user_id == user_id,
@@ -351,7 +478,7 @@ class PlugRepository(BaseRepository[Plug]):
                 "recent_conversions": recent_conversions
             }
             
-            logger.debug(f"Generated plug stats for user {user_id}: {stats}")
+            logger.debug("Generated plug stats for user %s: %s", user_id, stats)
             return stats
             
         except Exception as e:
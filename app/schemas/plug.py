@@ -8,7 +8,14 @@ from uuid import UUID
 from pydantic import BaseModel, Field, EmailStr, HttpUrl, validator
 from typing import Dict, Any
 
-from app.models.plug import PlugType, NetworkType, BusinessType, Priority
+from app.models.plug import PlugType, NetworkType, BusinessType, Priority, RESERVED_CUSTOM_DATA_KEYS
+
+
+def _check_reserved_custom_data_keys(custom_data: Dict[str, Any]) -> None:
+    """Reject custom_data keys that duplicate dedicated plug columns."""
+    reserved = sorted(RESERVED_CUSTOM_DATA_KEYS.intersection(custom_data))
+    if reserved:
+        raise ValueError(f"Custom data must not contain {', '.join(reserved)}; use the dedicated fields")
 
 
 class PlugBase(BaseModel):
@@ -73,6 +80,7 @@ class ContactCreate(PlugBase):
             # Limit custom_data size to prevent abuse
             if len(str(v)) > 10000:  # 10KB limit
                 raise ValueError('Custom data is too large (max 10KB)')
+            _check_reserved_custom_data_keys(v)
         return v
 
 
@@ -109,6 +117,7 @@ class ContactUpdate(BaseModel):
                 raise ValueError('Metadata must be a dictionary')
             if len(str(v)) > 10000:
                 raise ValueError('Metadata is too large (max 10KB)')
+            _check_reserved_custom_data_keys(v)
         return v
 
 
@@ -136,6 +145,7 @@ class TargetToContactConversion(BaseModel):
                 raise ValueError('Metadata must be a dictionary')
             if len(str(v)) > 10000:
                 raise ValueError('Metadata is too large (max 10KB)')
+            _check_reserved_custom_data_keys(v)
         return v
 
 
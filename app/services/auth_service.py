@@ -8,6 +8,7 @@ from datetime import datetime, timedelta, timezone
 from app.utils.datetime import get_current_utc_time
 import logging
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -51,8 +52,11 @@ class AuthService(BaseService[User]):
         return security_config.generate_secure_token(32)
     
     def _get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email address."""
-        return self.get_by_field("email", email)
+        """Get user by email address, ignoring case (served by ix_users_email_lower)."""
+        return self.db.query(User).filter(
+            func.lower(User.email) == email.strip().lower(),
+            User.is_deleted == False
+        ).first()
     
     def _create_auth_tokens(self, user: User) -> AuthTokenResponse:
         """Create JWT tokens for authenticated user."""
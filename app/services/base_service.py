@@ -55,8 +55,8 @@ class BaseService(ABC, Generic[T]):
             self.get_model_class().id == id
         )
         
-        if not include_deleted:
-            query = query.filter(self.get_model_class().is_deleted == False)
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
         
         return query.first()
     
@@ -76,8 +76,8 @@ class BaseService(ABC, Generic[T]):
             getattr(self.get_model_class(), field_name) == value
         )
         
-        if not include_deleted:
-            query = query.filter(self.get_model_class().is_deleted == False)
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
         
         return query.first()
     
@@ -2,7 +2,7 @@
 Event media service for media operations.
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
@@ -15,6 +15,7 @@ from app.schemas.event import EventMediaCreate, EventMediaUpdate, EventMediaUplo
 from app.services.decorators import handle_service_errors, require_event_ownership
 from app.services.event_base_service import EventBaseService
 from app.services.s3_service import s3_service
+from app.utils.helpers import generate_uuid7
 
 logger = logging.getLogger(__name__)
 
@@ -143,13 +144,12 @@ class EventMediaService(EventBaseService):
             
             # Always create a zone for every upload (even without metadata)
             # This ensures the zone can be retrieved and metadata can be added later
-            from uuid import uuid4
             zone = EventMediaZone(
-                id=uuid4(),
+                id=generate_uuid7(),
                 event_id=event_id,
                 title=upload_data.title[:256] if upload_data.title and len(upload_data.title) > 256 else upload_data.title,
                 description=upload_data.description,
-                tags=self._convert_tags_to_string({"tags": upload_data.tags or []})["tags"]
+                tags=list(upload_data.tags) if upload_data.tags else None
             )
             self.db.add(zone)
             self.db.flush()
@@ -487,16 +487,14 @@ class EventMediaService(EventBaseService):
         Returns:
             Dictionary with successful uploads, failed uploads, counts, and zone_id
         """
-        from uuid import uuid4
-        
         # Step 1: Always create a zone for every batch upload (even without metadata)
         # This ensures the zone can be retrieved and metadata can be added later
         zone = EventMediaZone(
-            id=uuid4(),
+            id=generate_uuid7(),
             event_id=event_id,
             title=upload_metadata.title,
             description=upload_metadata.description,
-            tags=self._convert_tags_to_string({"tags": upload_metadata.tags or []})["tags"]
+            tags=list(upload_metadata.tags) if upload_metadata.tags else None
         )
         self.db.add(zone)
         self.db.flush()  # Get the zone ID without committing
@@ -865,12 +863,12 @@ class EventMediaService(EventBaseService):
         if 'tags' in update_data:
             tags = update_data['tags']
             if isinstance(tags, list):
-                zone.tags = ', '.join(str(tag) for tag in tags) if tags else None
+                zone.set_tags_list([str(tag) for tag in tags])
             elif isinstance(tags, str):
-                zone.tags = tags
+                zone.set_tags_list([tag.strip() for tag in tags.split(",") if tag.strip()])
         
         # Update timestamp
-        zone.updated_at = datetime.utcnow()
+        zone.updated_at = datetime.now(timezone.utc)
         
         # Commit changes
         self.db.commit()
@@ -952,7 +950,7 @@ class EventMediaService(EventBaseService):
         
         # Update zone timestamp if any files were added
         if successful:
-            zone.updated_at = datetime.utcnow()
+            zone.updated_at = datetime.now(timezone.utc)
             self.db.commit()
         
         return {
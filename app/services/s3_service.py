@@ -3,7 +3,7 @@ S3 service for handling file uploads, downloads, and management.
 """
 import logging
 import mimetypes
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import BinaryIO, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
@@ -114,7 +114,7 @@ class S3Service:
             Unique S3 key
         """
         if timestamp is None:
-            timestamp = datetime.utcnow()
+            timestamp = datetime.now(timezone.utc)
         
         # Extract file extension
         file_ext = ""
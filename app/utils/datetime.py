@@ -1,9 +1,13 @@
 """
 Common datetime utilities for consistent timezone handling.
 """
-from datetime import datetime, timezone
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone, tzinfo
 from typing import Optional
 
+# Request-scoped clock so every model serialized in one request shares a single "now"
+request_now: ContextVar[Optional[datetime]] = ContextVar('request_now', default=None)
+
 
 def get_current_utc_time() -> datetime:
     """
@@ -83,3 +87,41 @@ def convert_to_utc(dt: datetime) -> datetime:
         # Assume naive datetime is UTC
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
+
+
+def bind_request_now() -> Token:
+    """
+    Capture the current UTC time as the clock for the current request scope.
+    
+    Returns:
+        Token: Token to pass to reset_request_now when the request ends
+    """
+    return request_now.set(datetime.now(timezone.utc))
+
+
+def reset_request_now(token: Token) -> None:
+    """
+    Restore the request clock to its state before bind_request_now.
+    
+    Args:
+        token: Token returned by bind_request_now
+    """
+    request_now.reset(token)
+
+
+def get_request_now(tz: Optional[tzinfo] = None) -> datetime:
+    """
+    Get the request-scoped current time, reading the clock only outside a request.
+    
+    Args:
+        tz: Timezone to express the time in; None gives naive local time like datetime.now()
+        
+    Returns:
+        datetime: Current time
+    """
+    now = request_now.get()
+    if now is None:
+        return datetime.now(tz)
+    if tz is None:
+        return now.astimezone().replace(tzinfo=None)
+    return now.astimezone(tz)
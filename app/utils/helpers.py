@@ -5,12 +5,13 @@ import hashlib
 import hmac
 import secrets
 import string
-from typing import Any, Dict, List, Optional, Union, TypeVar, Generic
+from typing import Any, Dict, List, Optional, Tuple, Union, TypeVar, Generic
 from datetime import datetime, timezone, timedelta
 import json
 import re
 from functools import wraps
 import time
+import uuid
 import asyncio
 from contextlib import asynccontextmanager
 import logging
@@ -90,6 +91,28 @@ def generate_api_key(prefix: str = "pk", length: int = 32) -> str:
     return f"{prefix}_{random_part}"
 
 
+def generate_uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so values created later
+    sort later and new primary keys land at the right edge of B-tree indexes.
+    
+    Returns:
+        uuid.UUID: Generated UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                       # version
+        | (rand >> 62) << 64              # rand_a, 12 bits
+        | 0b10 << 62                      # RFC 4122 variant
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)  # rand_b, 62 bits
+    )
+    return uuid.UUID(int=value)
+
+
 def hash_string(value: str, salt: Optional[str] = None) -> str:
     """
     Hash a string using SHA-256.
@@ -465,7 +488,7 @@ def timing_decorator(func):
         try:
             result = func(*args, **kwargs)
             execution_time = time.time() - start_time
-            logger.debug(f"Function {func.__name__} executed in {execution_time:.4f}s")
+            logger.debug("Function %s executed in %.4fs", func.__name__, execution_time)
             return result
         except Exception as e:
             execution_time = time.time() - start_time
@@ -479,13 +502,13 @@ def timing_decorator(func):
 async def async_timing_context(operation_name: str):
     """Async context manager for timing operations."""
     start_time = time.time()
-    logger.debug(f"Starting {operation_name}")
+    logger.debug("Starting %s", operation_name)
     
     try:
         yield
     finally:
         execution_time = time.time() - start_time
-        logger.debug(f"Completed {operation_name} in {execution_time:.4f}s")
+        logger.debug("Completed %s in %.4fs", operation_name, execution_time)
 
 
 def normalize_phone_number(phone: str) -> str:
@@ -584,3 +607,65 @@ def get_client_ip(request_headers: Dict[str, str]) -> str:
             return match.group(1).strip('"[]')
     
     return request_headers.get('remote-addr', 'unknown')
+
+
+def get_client_ip_asgi(
+    scope_headers: List[Tuple[bytes, bytes]],
+    client: Optional[Tuple[str, int]] = None
+) -> str:
+    """
+    Extract client IP address from raw ASGI headers.
+    
+    Same precedence as get_client_ip, but only the proxy headers are
+    inspected and decoded, without building a headers dict first.
+    
+    Args:
+        scope_headers: ASGI ``scope["headers"]`` list of (name, value) byte pairs
+        client: ASGI ``scope["client"]`` (host, port) tuple, if any
+        
+    Returns:
+        str: Client IP address
+    """
+    real_ip = forwarded = remote_addr = None
+    for name, value in scope_headers:
+        if name == b'x-forwarded-for':
+            forwarded_for = value.split(b',')[0].strip()
+            if forwarded_for:
+                return forwarded_for.decode('latin-1')
+        elif name == b'x-real-ip':
+            real_ip = real_ip or value.strip()
+        elif name == b'forwarded':
+            forwarded = forwarded or value
+        elif name == b'remote-addr':
+            remote_addr = remote_addr or value
+    
+    if real_ip:
+        return real_ip.decode('latin-1')
+    
+    if forwarded:
+        # Parse Forwarded header (RFC 7239)
+        match = re.search(r'for=([^;,\s]+)', forwarded.decode('latin-1'))
+        if match:
+            return match.group(1).strip('"[]')
+    
+    if remote_addr:
+        return remote_addr.decode('latin-1')
+    
+    return client[0] if client else 'unknown'
+
+
+def header_get(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[bytes]:
+    """
+    Look up a header in raw ASGI headers without building a headers mapping.
+    
+    Args:
+        headers: ASGI list of (name, value) byte pairs
+        name: Lowercase header name as bytes
+        
+    Returns:
+        Optional[bytes]: First matching header value, or None if absent
+    """
+    for key, value in headers:
+        if key == name:
+            return value
+    return None
@@ -1,7 +1,7 @@
 """
 Cleanup worker for maintenance tasks.
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 import logging
 
@@ -39,7 +39,7 @@ def cleanup_old_data(self) -> Dict[str, Any]:
         with db_config.get_session() as session:
             for table, days_to_keep in cleanup_rules.items():
                 try:
-                    cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+                    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
                     
                     # Example cleanup queries (adjust based on actual schema)
                     if table == "audit_logs":
@@ -71,7 +71,7 @@ def cleanup_old_data(self) -> Dict[str, Any]:
                         query, 
                         {
                             "cutoff_date": cutoff_date,
-                            "now": datetime.utcnow()
+                            "now": datetime.now(timezone.utc)
                         }
                     )
                     
@@ -159,7 +159,7 @@ def health_check(self) -> Dict[str, Any]:
     try:
         health_results = {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "checks": {}
         }
         
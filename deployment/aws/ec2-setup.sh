@@ -109,7 +109,7 @@ Environment=PATH=$APP_DIR/venv/bin
 Environment=PYTHONPATH=$APP_DIR
 Environment=ENVIRONMENT=production
 Environment=DEBUG=false
-ExecStart=$APP_DIR/venv/bin/uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4
+ExecStart=$APP_DIR/venv/bin/uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 4 --loop uvloop --http httptools
 ExecReload=/bin/kill -HUP \$MAINPID
 Restart=always
 RestartSec=10
@@ -0,0 +1,45 @@
+"""
+In-memory SQLite database for model and repository tests.
+
+The models use PostgreSQL column types; they are rendered as close SQLite
+equivalents so ORM behavior can be exercised without a database server.
+"""
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import Table, create_engine
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from app.models.base import BaseModel
+
+
+@compiles(UUID, "sqlite")
+def _compile_uuid(type_, compiler, **kw) -> str:
+    return "CHAR(32)"
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb(type_, compiler, **kw) -> str:
+    return "JSON"
+
+
+@contextmanager
+def sqlite_session(*tables: Table) -> Iterator[Session]:
+    """
+    Open a session on a fresh in-memory database containing the given tables.
+    
+    Args:
+        tables: Tables to create
+        
+    Yields:
+        Session bound to the database, closed on exit
+    """
+    engine = create_engine("sqlite://")
+    BaseModel.metadata.create_all(engine, tables=list(tables))
+    try:
+        with Session(engine) as session:
+            yield session
+    finally:
+        engine.dispose()
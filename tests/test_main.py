@@ -0,0 +1,35 @@
+"""
+Tests for application-level middleware and exception handlers.
+"""
+from fastapi.testclient import TestClient
+
+from app.main import create_application
+
+
+class TestUnhandledErrors:
+    """Test the response rendered for unhandled exceptions."""
+    
+    def _client(self) -> TestClient:
+        app = create_application()
+        
+        @app.get("/boom")
+        async def boom():
+            raise RuntimeError("boom")
+        
+        return TestClient(app, raise_server_exceptions=False)
+    
+    def test_500_includes_generated_correlation_id(self):
+        """Test that a 500 body carries the correlation ID the request was logged with."""
+        response = self._client().get("/boom")
+        
+        assert response.status_code == 500
+        correlation_id = response.json()["error"]["correlation_id"]
+        assert correlation_id
+        assert len(correlation_id) == 32
+    
+    def test_500_includes_upstream_correlation_id(self):
+        """Test that a caller-supplied correlation ID is echoed in the 500 body."""
+        response = self._client().get("/boom", headers={"X-Correlation-ID": "req-123"})
+        
+        assert response.status_code == 500
+        assert response.json()["error"]["correlation_id"] == "req-123"
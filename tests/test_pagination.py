@@ -0,0 +1,56 @@
+"""
+Tests for pagination helpers.
+"""
+import pytest
+from pydantic import BaseModel
+
+from app.core.pagination import PaginatedResponse, iter_paginate
+
+
+class Item(BaseModel):
+    """Item schema used as the page item type."""
+    name: str
+
+
+class TestPaginatedResponse:
+    """Test building paginated responses."""
+    
+    def test_items_are_coerced_into_item_type(self):
+        """Test that items are validated into the response's item type."""
+        response = PaginatedResponse[Item].create(items=[{"name": "a"}], total=1, page=1, per_page=20)
+        
+        assert isinstance(response.items[0], Item)
+        assert response.pagination.pages == 1
+    
+    def test_non_int_values_are_rejected(self):
+        """Test that unvalidated metadata cannot be built from non-int values."""
+        with pytest.raises(TypeError):
+            PaginatedResponse.create(items=[], total="10", page=1, per_page=20)
+
+
+class TestIterPaginate:
+    """Test paginating iterables without materializing them."""
+    
+    def test_returns_requested_page(self):
+        """Test that only the requested page is returned, with a peeked has_next."""
+        response = iter_paginate(iter(range(50)), page=2, per_page=20)
+        
+        assert response.items == list(range(20, 40))
+        assert response.pagination.has_prev is True
+        assert response.pagination.has_next is True
+    
+    def test_out_of_range_values_are_clamped(self):
+        """Test that page and per_page below 1 are clamped instead of raising."""
+        response = iter_paginate(range(50), page=0, per_page=0)
+        
+        assert response.items == [0]
+        assert response.pagination.page == 1
+        assert response.pagination.per_page == 1
+    
+    def test_negative_page_is_clamped(self):
+        """Test that a negative page is treated as the first page."""
+        response = iter_paginate(range(50), page=-3, per_page=10, total=50)
+        
+        assert response.items == list(range(10))
+        assert response.pagination.page == 1
+        assert response.pagination.pages == 5
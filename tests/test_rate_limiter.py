@@ -0,0 +1,112 @@
+"""
+Tests for the in-process rate limiter state.
+"""
+import json
+import time
+from unittest.mock import MagicMock
+
+from app.core.rate_limiter import RateLimiter
+
+
+def _limiter(store: dict) -> RateLimiter:
+    limiter = RateLimiter()
+    limiter.cache = MagicMock()
+    limiter.cache.get.side_effect = store.get
+    return limiter
+
+
+class TestRateLimiterState:
+    """Test the local fast path and mirrored state."""
+    
+    def test_cold_start_falls_back_to_redis(self):
+        """Test that failures recorded before this worker started are still enforced."""
+        key = "rate_limit:login:user@example.com"
+        store = {key: json.dumps({"attempts": 5, "window_start": int(time.time())})}
+        limiter = _limiter(store)
+        
+        allowed, retry_after = limiter.check_rate_limit("login", "user@example.com")
+        
+        assert allowed is False
+        assert retry_after > 0
+    
+    def test_warm_subscription_skips_redis_for_clean_keys(self):
+        """Test that identifiers Redis reported clean skip Redis once the subscription is warm."""
+        limiter = _limiter({})
+        limiter._pubsub_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        limiter._warm_at = time.monotonic() - 1
+        
+        assert limiter.check_rate_limit("login", "user@example.com") == (True, None)
+        assert limiter.check_rate_limit("login", "user@example.com") == (True, None)
+        limiter.cache.get.assert_called_once()
+    
+    def test_warm_subscription_checks_redis_for_unverified_keys(self):
+        """Test that a local miss alone does not let failures in Redis through."""
+        key = "rate_limit:login:user@example.com"
+        store = {key: json.dumps({"attempts": 50, "window_start": int(time.time())})}
+        limiter = _limiter(store)
+        limiter._pubsub_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        limiter._warm_at = time.monotonic() - 1
+        
+        allowed, retry_after = limiter.check_rate_limit("login", "user@example.com")
+        
+        assert allowed is False
+        assert retry_after > 0
+    
+    def test_dropped_event_is_caught_by_recheck(self):
+        """Test that failures whose event was lost are enforced after the re-check interval."""
+        key = "rate_limit:login:user@example.com"
+        store = {}
+        limiter = _limiter(store)
+        limiter._pubsub_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        limiter._warm_at = time.monotonic() - 1
+        assert limiter.check_rate_limit("login", "user@example.com") == (True, None)
+        
+        # Another worker records failures but its event never arrives
+        store[key] = json.dumps({"attempts": 50, "window_start": int(time.time())})
+        assert limiter.check_rate_limit("login", "user@example.com") == (True, None)
+        limiter._verified[key] = time.monotonic() - 1
+        
+        allowed, retry_after = limiter.check_rate_limit("login", "user@example.com")
+        
+        assert allowed is False
+        assert retry_after > 0
+    
+    def test_dead_subscription_falls_back_to_redis(self):
+        """Test that a dead listener thread stops the fast path and the mirror."""
+        key = "rate_limit:login:user@example.com"
+        store = {key: json.dumps({"attempts": 50, "window_start": int(time.time())})}
+        limiter = _limiter(store)
+        limiter._pubsub_thread = MagicMock(is_alive=MagicMock(return_value=False))
+        limiter._warm_at = time.monotonic() - 1
+        limiter._mirror[key] = (0, int(time.time()))
+        
+        allowed, retry_after = limiter.check_rate_limit("login", "user@example.com")
+        
+        assert allowed is False
+        assert retry_after > 0
+    
+    def test_subscription_error_resets_warmup(self, monkeypatch):
+        """Test that a pub/sub failure drops the mirror and goes cold again."""
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        limiter = _limiter({})
+        limiter._pubsub_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        limiter._warm_at = time.monotonic() - 1
+        limiter._mirror["rate_limit:login:user@example.com"] = (3, int(time.time()))
+        
+        limiter._handle_subscription_error(ConnectionError("lost"), MagicMock(), limiter._pubsub_thread)
+        
+        assert limiter._mirror == {}
+        assert limiter._warm_at > time.monotonic()
+        assert limiter.check_rate_limit("login", "user@example.com") == (True, None)
+        limiter.cache.get.assert_called_once()
+    
+    def test_expired_lockouts_are_pruned(self):
+        """Test that mirrored lockouts stay bounded."""
+        limiter = _limiter({})
+        limiter._lockouts_maxsize = 10
+        now = int(time.time())
+        
+        for i in range(100):
+            limiter._apply_event({"key": f"account_lockout:{i}", "unlock_time": now - 1})
+        
+        assert len(limiter._lockouts) <= 10
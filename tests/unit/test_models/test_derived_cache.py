@@ -0,0 +1,70 @@
+"""
+Tests for cached values derived from column data.
+"""
+from functools import cached_property
+
+from sqlalchemy import Integer, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+from tests.fixtures.database import sqlite_session
+
+
+class CachedLabelModel(BaseModel):
+    """Model with a cached_property computed from a column."""
+    __tablename__ = "cached_label_models"
+    
+    _derived_cache_attrs = ("label",)
+    
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    
+    @cached_property
+    def label(self) -> str:
+        return f"count={self.count}"
+
+
+def _bump(session, value: int) -> None:
+    """Change the row behind the session's back, like a bulk UPDATE."""
+    session.execute(
+        update(CachedLabelModel).values(count=value).execution_options(synchronize_session=False)
+    )
+
+
+class TestDerivedCache:
+    """Test that derived caches are dropped when column data is reloaded."""
+    
+    def test_refresh_drops_cache(self):
+        with sqlite_session(CachedLabelModel.__table__) as session:
+            model = CachedLabelModel(count=1)
+            session.add(model)
+            session.flush()
+            assert model.label == "count=1"
+            
+            _bump(session, 2)
+            session.refresh(model)
+            
+            assert model.label == "count=2"
+    
+    def test_expire_drops_cache(self):
+        with sqlite_session(CachedLabelModel.__table__) as session:
+            model = CachedLabelModel(count=1)
+            session.add(model)
+            session.flush()
+            assert model.label == "count=1"
+            
+            _bump(session, 3)
+            session.expire(model)
+            
+            assert model.label == "count=3"
+    
+    def test_populate_existing_drops_cache(self):
+        with sqlite_session(CachedLabelModel.__table__) as session:
+            model = CachedLabelModel(count=1)
+            session.add(model)
+            session.flush()
+            assert model.label == "count=1"
+            
+            _bump(session, 4)
+            session.query(CachedLabelModel).populate_existing().all()
+            
+            assert model.label == "count=4"
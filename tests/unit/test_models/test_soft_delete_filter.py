@@ -0,0 +1,110 @@
+"""
+Tests for the session-wide soft-delete filter on ORM SELECTs.
+"""
+from typing import List
+
+from sqlalchemy import ForeignKey, String, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import INCLUDE_DELETED, BaseModel
+from tests.fixtures.database import sqlite_session
+
+
+class FilterParent(BaseModel):
+    """Parent model with a one-to-many collection."""
+    __tablename__ = "filter_parents"
+    
+    name: Mapped[str] = mapped_column(String(32), nullable=False)
+    children: Mapped[List["FilterChild"]] = relationship(back_populates="parent")
+
+
+class FilterChild(BaseModel):
+    """Child model with a many-to-one reference."""
+    __tablename__ = "filter_children"
+    
+    name: Mapped[str] = mapped_column(String(32), nullable=False)
+    parent_id: Mapped[object] = mapped_column(UUID(as_uuid=True), ForeignKey("filter_parents.id"))
+    parent: Mapped[FilterParent] = relationship(back_populates="children")
+
+
+def _session():
+    return sqlite_session(FilterParent.__table__, FilterChild.__table__)
+
+
+def _names(rows) -> List[str]:
+    return sorted(row.name for row in rows)
+
+
+class TestSoftDeleteFilter:
+    """Test which rows ORM queries see once records are soft-deleted."""
+    
+    def test_select_excludes_deleted_rows(self):
+        with _session() as session:
+            kept, deleted = FilterParent(name="kept"), FilterParent(name="deleted")
+            session.add_all([kept, deleted])
+            session.flush()
+            deleted.soft_delete()
+            session.flush()
+            
+            assert _names(session.scalars(select(FilterParent))) == ["kept"]
+            assert _names(session.query(FilterParent).all()) == ["kept"]
+            assert session.query(FilterParent).count() == 1
+    
+    def test_include_deleted_opt_out(self):
+        with _session() as session:
+            kept, deleted = FilterParent(name="kept"), FilterParent(name="deleted")
+            session.add_all([kept, deleted])
+            session.flush()
+            deleted.soft_delete()
+            session.flush()
+            
+            rows = session.scalars(
+                select(FilterParent).execution_options(**{INCLUDE_DELETED: True})
+            )
+            assert _names(rows) == ["deleted", "kept"]
+    
+    def test_restore_makes_row_visible_again(self):
+        with _session() as session:
+            model = FilterParent(name="restored")
+            session.add(model)
+            session.flush()
+            model.soft_delete()
+            session.flush()
+            assert session.scalars(select(FilterParent)).all() == []
+            
+            model.restore()
+            session.flush()
+            
+            assert _names(session.scalars(select(FilterParent))) == ["restored"]
+            assert model.deleted_at is None
+    
+    def test_relationship_collections_exclude_deleted_rows(self):
+        with _session() as session:
+            parent = FilterParent(name="parent")
+            live, deleted = FilterChild(name="live"), FilterChild(name="deleted")
+            parent.children = [live, deleted]
+            session.add(parent)
+            session.flush()
+            deleted.soft_delete()
+            session.flush()
+            session.expire_all()
+            
+            assert _names(parent.children) == ["live"]
+    
+    def test_joined_rows_of_deleted_parents_are_excluded(self):
+        with _session() as session:
+            parent = FilterParent(name="parent")
+            child = FilterChild(name="child", parent=parent)
+            session.add(child)
+            session.flush()
+            parent.soft_delete()
+            session.flush()
+            # Start from an empty identity map so the lazy load has to query
+            session.expunge_all()
+            
+            joined = session.scalars(select(FilterChild).join(FilterChild.parent)).all()
+            assert joined == []
+            
+            child = session.scalars(select(FilterChild)).one()
+            assert child.parent is None
@@ -0,0 +1,147 @@
+"""
+Tests for BaseRepository bulk operations.
+"""
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy import Integer, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column, validates
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.models.base import BaseModel
+from app.repositories.base import BaseRepository
+from tests.fixtures.database import sqlite_session
+
+
+class BulkItem(BaseModel):
+    """Model with a validator and a server default."""
+    __tablename__ = "bulk_items"
+    
+    code: Mapped[str] = mapped_column(String(32), nullable=False)
+    rank: Mapped[int] = mapped_column(Integer, nullable=False, server_default="7")
+    
+    @validates("code")
+    def _normalize_code(self, key: str, value: str) -> str:
+        return value.strip().lower()
+
+
+class TestBulkCreate:
+    """Test ORM bulk INSERT with RETURNING."""
+    
+    @pytest.mark.asyncio
+    async def test_returns_objects_in_input_order_with_server_defaults(self):
+        with sqlite_session(BulkItem.__table__) as session:
+            repository = BaseRepository(session, BulkItem)
+            codes = [f"item-{i:03d}" for i in range(50, 0, -1)]
+            
+            created = await repository.bulk_create([{"code": code} for code in codes])
+            
+            assert [item.code for item in created] == codes
+            assert all(item.rank == 7 for item in created)
+            assert all(item.created_at is not None for item in created)
+            assert len({item.id for item in created}) == len(codes)
+    
+    @pytest.mark.asyncio
+    async def test_applies_model_validators(self):
+        with sqlite_session(BulkItem.__table__) as session:
+            repository = BaseRepository(session, BulkItem)
+            
+            created = await repository.bulk_create([{"code": "  MiXeD "}, {"code": "lower", "rank": 1}])
+            
+            assert [item.code for item in created] == ["mixed", "lower"]
+            assert [item.rank for item in created] == [7, 1]
+
+
+class TestBulkUpdate:
+    """Test UPDATE ... FROM (VALUES ...) bulk updates against a mocked session."""
+    
+    @staticmethod
+    def _repository(reloaded=()):
+        session = MagicMock()
+        session.query.return_value.filter.return_value.populate_existing.return_value.all.return_value = list(reloaded)
+        return BaseRepository(session, BulkItem), session
+    
+    @staticmethod
+    def _statements(session):
+        return [
+            call.args[0].compile(dialect=postgresql.dialect())
+            for call in session.execute.call_args_list
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_groups_rows_by_updated_columns(self):
+        repository, session = self._repository()
+        first, second, third = uuid4(), uuid4(), uuid4()
+        
+        await repository.bulk_update([
+            {"id": first, "code": "a"},
+            {"id": second, "rank": 2},
+            {"id": third, "code": "c"},
+        ])
+        
+        statements = self._statements(session)
+        assert len(statements) == 2
+        code_stmt, rank_stmt = statements
+        assert "SET code=" in str(code_stmt) and "rank=" not in str(code_stmt)
+        assert "SET rank=" in str(rank_stmt) and "code=" not in str(rank_stmt)
+        assert list(code_stmt.params.values()).count(first) == 1
+        assert third in code_stmt.params.values()
+        assert second in rank_stmt.params.values()
+    
+    @pytest.mark.asyncio
+    async def test_repeated_ids_are_merged_with_last_value_winning(self):
+        repository, session = self._repository()
+        record_id = uuid4()
+        
+        await repository.bulk_update([
+            {"id": record_id, "code": "first", "rank": 1},
+            {"id": str(record_id), "code": "second"},
+        ])
+        
+        (statement,) = self._statements(session)
+        params = list(statement.params.values())
+        assert params.count(record_id) == 1
+        assert "second" in params and "first" not in params
+        assert 1 in params
+    
+    @pytest.mark.asyncio
+    async def test_skips_soft_deleted_rows(self):
+        repository, session = self._repository()
+        
+        await repository.bulk_update([{"id": uuid4(), "code": "a"}])
+        
+        (statement,) = self._statements(session)
+        assert "bulk_items.is_deleted = false" in str(statement)
+    
+    @pytest.mark.asyncio
+    async def test_returns_objects_in_input_order(self):
+        ids = [uuid4() for _ in range(3)]
+        reloaded = [BulkItem(id=record_id, code="x") for record_id in reversed(ids)]
+        repository, _ = self._repository(reloaded[:2])
+        
+        updated = await repository.bulk_update([{"id": record_id, "code": "x"} for record_id in ids])
+        
+        # The third row is missing from the reload, as a soft-deleted row would be
+        assert [item.id for item in updated] == ids[1:]
+    
+    @pytest.mark.asyncio
+    async def test_applies_model_validators(self):
+        repository, session = self._repository()
+        
+        await repository.bulk_update([{"id": uuid4(), "code": "  MiXeD "}])
+        
+        (statement,) = self._statements(session)
+        assert "mixed" in statement.params.values()
+    
+    @pytest.mark.asyncio
+    async def test_malformed_id_raises_validation_error(self):
+        repository, session = self._repository()
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await repository.bulk_update([{"id": "not-a-uuid", "code": "a"}])
+        
+        assert exc_info.value.error_code == "INVALID_ID_FIELD"
+        session.execute.assert_not_called()
@@ -0,0 +1,62 @@
+"""
+Unit tests for PlugRepository bulk import.
+"""
+import csv
+import io
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.repositories.plug_repository import PlugRepository
+
+
+class TestCopyImport:
+    """Test COPY-based plug import row handling."""
+    
+    @pytest.fixture
+    def cursor(self):
+        """DBAPI cursor capturing the COPY payload."""
+        cursor = MagicMock()
+        cursor.copied = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: cursor.copied.append(buffer.getvalue())
+        return cursor
+    
+    @pytest.fixture
+    def repository(self, cursor):
+        """PlugRepository on a mocked PostgreSQL session."""
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        session.connection.return_value.connection.cursor.return_value.__enter__.return_value = cursor
+        return PlugRepository(session)
+    
+    @pytest.mark.asyncio
+    async def test_valid_rows_are_copied(self, repository, cursor):
+        count = await repository.copy_import(uuid4(), [
+            {"first_name": "Ada", "plug_type": "contact", "priority": "high", "tags": ["a"]},
+            {"first_name": "Bob"},
+        ])
+        
+        assert count == 2
+        rows = list(csv.reader(io.StringIO(cursor.copied[0])))
+        assert [row[3] for row in rows] == ["Ada", "Bob"]
+        # plug_type is written as its SMALLINT code, priority as the member name
+        assert rows[0][2] == "2" and rows[0][19] == "HIGH"
+        assert rows[1][2] == "1" and rows[1][19] == "MEDIUM"
+    
+    @pytest.mark.asyncio
+    async def test_invalid_value_raises_validation_error(self, repository, cursor):
+        with pytest.raises(ValidationError) as exc_info:
+            await repository.copy_import(uuid4(), [{"first_name": "Ada"}, {"plug_type": "lead"}])
+        
+        assert exc_info.value.details["row"] == 1
+        cursor.copy_expert.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_unknown_keys_are_rejected(self, repository, cursor):
+        with pytest.raises(ValidationError) as exc_info:
+            await repository.copy_import(uuid4(), [{"first_name": "Ada", "nickname": "A"}])
+        
+        assert exc_info.value.details["unknown_fields"] == ["nickname"]
+        cursor.copy_expert.assert_not_called()